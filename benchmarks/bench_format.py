@@ -0,0 +1,38 @@
+"""
+Microbenchmark of the compiled formatter against the step-by-step formatting.
+
+Run from the repository root: python -m benchmarks.bench_format [repeats]
+"""
+
+import json
+import sys
+import timeit
+from src._utils._format import Format
+
+REPORT = {"bike_id": 1, "mode": "usage", "battery_level": 87.3, "speed": 20,
+          "position": (13.4562341, 55.1234567), "timestamp": "2024-12-23T12:00:00+00:00",
+          "city_id": 1}
+LOG = {"user_id": 1, "bike_id": 1, "trip_id": 2, "start_time": "2024-12-23T12:00:00+00:00",
+       "start_position": (13.4562341, 55.1234567),
+       "route": [(13.4562341 + index / 1000, 55.1234567) for index in range(50)],
+       "start_zone_id": 1, "start_zone_type": "parking",
+       "end_time": "2024-12-23T12:10:00+00:00", "end_position": (13.5062341, 55.1234567),
+       "end_zone_id": 2, "end_zone_type": "charging"}
+
+def step_by_step(entry):
+    """Format a copy of the entry the way Format did before plans were compiled."""
+    return Format._apply_all_formatting(dict(entry)) # pylint: disable=protected-access
+
+def main():
+    """Checks that both formatters agree and prints the time per entry."""
+    repeats = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    for name, entry in (("report", REPORT), ("log", LOG)):
+        assert json.dumps(Format.report(entry)) == json.dumps(step_by_step(entry))
+        legacy = timeit.timeit(lambda entry=entry: step_by_step(entry), number=repeats)
+        compiled = timeit.timeit(lambda entry=entry: Format.report(entry), number=repeats)
+        print(f"{name}: step by step {legacy / repeats * 1e6:7.2f} us, "
+              f"compiled {compiled / repeats * 1e6:7.2f} us, "
+              f"speedup {legacy / compiled:5.2f}x")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""
+Benchmark of the sharded hivemind.
+
+Starts 1, 2, 4 and 8 shard processes and drives each of them from its own
+load process for a fixed duration, then prints the total number of
+requests per second and the speedup over a single shard.
+
+Run from the repository root: python -m benchmarks.bench_shards [seconds] [bikes]
+"""
+
+import asyncio
+import multiprocessing
+import os
+import sys
+import tempfile
+import time
+import httpx
+
+os.environ.setdefault("SHARD_SOCKET_DIR", tempfile.mkdtemp())
+os.environ.setdefault("BACKEND_URL", "http://127.0.0.1:9/")
+
+from src.brain._shard import Shards # pylint: disable=wrong-import-position
+
+async def drive(index, bike_ids, seconds):
+    """Sends report and relocate requests to one shard until the time is up."""
+    transport = httpx.AsyncHTTPTransport(uds=Shards.socket_path(index))
+    count = 0
+    async with httpx.AsyncClient(transport=transport, base_url="http://shard") as client:
+        deadline = time.monotonic() + seconds
+        while time.monotonic() < deadline:
+            bike_id = bike_ids[count % len(bike_ids)]
+            await client.get("/report", params={"bike_id": bike_id})
+            await client.post("/relocate", params={"bike_id": bike_id},
+                              json={"position": [13.0 + count % 100 / 1000, 55.0]})
+            count += 2
+    return count
+
+def load(args):
+    """Entry point of a load process."""
+    return asyncio.run(drive(*args))
+
+def run(workers, bike_ids, seconds):
+    """Returns the requests per second handled by the given number of shards."""
+    positions = [(13.0, 55.0)] * len(bike_ids)
+    processes = Shards.start(bike_ids, positions, "token", workers)
+    try:
+        asyncio.run(Shards.wait(range(workers)))
+        shards = Shards.partition(bike_ids, positions, workers)
+        with multiprocessing.get_context('spawn').Pool(workers) as pool:
+            counts = pool.map(load, [(index, shard[0], seconds)
+                                     for index, shard in enumerate(shards)])
+        return sum(counts) / seconds
+    finally:
+        Shards.stop(processes)
+
+def main():
+    """Runs the benchmark for 1 to 8 shards."""
+    seconds = float(sys.argv[1]) if len(sys.argv) > 1 else 5.0
+    bikes = int(sys.argv[2]) if len(sys.argv) > 2 else 800
+    bike_ids = list(range(1, bikes + 1))
+    print(f"cpus: {os.cpu_count()}, bikes: {bikes}, seconds per run: {seconds}")
+    baseline = None
+    for workers in (1, 2, 4, 8):
+        throughput = run(workers, bike_ids, seconds)
+        baseline = baseline or throughput
+        print(f"{workers} shards: {throughput:10.1f} requests/s, "
+              f"speedup {throughput / baseline:4.2f}x")
+
+if __name__ == "__main__":
+    main()
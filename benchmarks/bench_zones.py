@@ -0,0 +1,28 @@
+"""
+Benchmark of classifying many positions against the zones in one batch.
+
+Run from the repository root: python -m benchmarks.bench_zones [positions]
+"""
+
+import sys
+import time
+import numpy as np
+from src._utils._map import Map
+
+def main():
+    """Classifies random positions around the bundled zones and prints the time taken."""
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    zones, zone_types = Map.Zones.load(), Map.ZoneTypes.load()
+    bounds = np.array([Map.Zone.get_centroid_position(zone) for zone in zones])
+    low, high = bounds.min(axis=0) - 0.01, bounds.max(axis=0) + 0.01
+    positions = np.random.default_rng(16).uniform(low, high, size=(count, 2))
+    Map.Zones.classify(zones, zone_types, positions[:10])
+    start = time.perf_counter()
+    classified = Map.Zones.classify(zones, zone_types, positions)
+    elapsed = time.perf_counter() - start
+    covered = int((classified['covering'] >= 0).sum())
+    print(f"{count} positions against {len(zones)} zones in {elapsed:.3f} s "
+          f"({covered} covered by a zone)")
+
+if __name__ == "__main__":
+    main()
@@ -4,9 +4,9 @@ This module contains the Trip class which contains information about a trip.
 This is also the contents of an unformatted log.
 """
 
-import copy
 from .._utils._clock import Clock
 from .._utils._map import Map
+from .._utils._route import Route
 
 class Trip:
     """Class representing a trip."""
@@ -17,7 +17,7 @@ class Trip:
         self.trip_id = trip_id
         self.start_time = Clock.now()
         self.start_position = position
-        self.route = [self.start_position]
+        self.route = Route([self.start_position])
         self.start_zone_id = None if not zone else Map.Zone.get_zone_id(zone)
         self.start_zone_type = None if not zone else Map.Zone.get_zone_type(zone)
 
@@ -33,5 +33,8 @@ class Trip:
         self.route.append(position)
 
     def get(self):
-        """Return a copy of the trip (i.e. an unformatted log)."""
-        return copy.deepcopy(self.__dict__)
+        """
+        Return a snapshot of the trip (i.e. an unformatted log).
+        All fields but the route are immutable, and the route is a snapshot sharing its positions.
+        """
+        return dict(self.__dict__, route=self.route.snapshot())
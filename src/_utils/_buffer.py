@@ -0,0 +1,112 @@
+"""
+Module for the bounded buffer used to retain reports and logs.
+"""
+
+import json
+import os
+from collections import deque, OrderedDict
+from itertools import islice
+from ._settings import Settings
+
+class Buffer:
+    """
+    Class representing a bounded buffer keeping the most recent entries in memory.
+
+    Once the buffer is full the oldest entry is dropped for every new one.
+    If a spill path is given, dropped entries are appended to it as JSON lines.
+    """
+    def __init__(self, capacity=None, spill=None, encode=None):
+        self.capacity = capacity if capacity else None
+        self.entries = deque(maxlen=self.capacity)
+        self.spill = spill
+        self.encode = encode
+        self.spilled = 0
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __iter__(self):
+        return iter(self.entries)
+
+    def __getitem__(self, index):
+        return self.entries[index]
+
+    def __setitem__(self, index, entry):
+        self.entries[index] = entry
+
+    def append(self, entry):
+        """Append an entry, dropping (and spilling) the oldest one if the buffer is full."""
+        if self.capacity and len(self.entries) == self.capacity:
+            self._spill(self.entries[0])
+        self.entries.append(entry)
+
+    def read_spilled(self):
+        """Return the entries that were spilled to disk, oldest first."""
+        if not self.spill or not os.path.exists(self.spill):
+            return []
+        with open(self.spill, 'r', encoding='utf-8') as file:
+            return [json.loads(line) for line in file]
+
+    def _spill(self, entry):
+        """Write a dropped entry to the spill file."""
+        self.spilled += 1
+        if not self.spill:
+            return
+        if self.encode:
+            entry = self.encode(entry)
+        with open(self.spill, 'a', encoding='utf-8') as file:
+            file.write(json.dumps(entry, default=str) + '\n')
+
+    @staticmethod
+    def spill_path(bike_id, name):
+        """Return the spill file for a bike, or None if spilling is disabled."""
+        if not Settings.Retention.spill_dir:
+            return None
+        return os.path.join(Settings.Retention.spill_dir, f'bike-{bike_id}-{name}.jsonl')
+
+class KeyedBuffer(Buffer):
+    """
+    Class representing a bounded buffer of entries that are looked up and updated by key.
+
+    Entries keep the position of their first insertion when updated.
+    Indexing is by position, like for Buffer, while get() and put() are by key.
+    """
+    def __init__(self, capacity=None, spill=None, encode=None):
+        super().__init__(capacity, spill, encode)
+        self.entries = OrderedDict()
+
+    def __iter__(self):
+        return iter(self.entries.values())
+
+    def __contains__(self, key):
+        return key in self.entries
+
+    def __getitem__(self, index):
+        if index == -1:
+            return self.entries[next(reversed(self.entries))]
+        if index < 0:
+            index += len(self.entries)
+        if not 0 <= index < len(self.entries):
+            raise IndexError("KeyedBuffer index out of range")
+        return next(islice(self.entries.values(), index, None))
+
+    def __setitem__(self, index, entry):
+        raise TypeError("KeyedBuffer entries are set by key, use put()")
+
+    def get(self, key, default=None):
+        """Return the entry with the key."""
+        return self.entries.get(key, default)
+
+    def put(self, key, entry):
+        """Add or replace the entry with the key, dropping (and spilling) the oldest if full."""
+        if key not in self.entries and self.capacity and len(self.entries) == self.capacity:
+            _, oldest = self.entries.popitem(last=False)
+            self._spill(oldest)
+        self.entries[key] = entry
+
+    def append(self, entry):
+        raise TypeError("KeyedBuffer entries are added by key, use put()")
+
+    def index(self, key):
+        """Return the position of the entry with the key, raising ValueError if missing."""
+        return list(self.entries).index(key)
@@ -3,6 +3,7 @@ Utility module for time-related tasks.
 """
 
 import asyncio
+import time
 from datetime import datetime, timezone
 
 class Clock:
@@ -13,6 +14,11 @@ class Clock:
         """Return the current time in ISO format."""
         return datetime.now(timezone.utc).isoformat()
 
+    @staticmethod
+    def monotonic():
+        """Return the value of a monotonic clock in seconds."""
+        return time.monotonic()
+
     @staticmethod
     async def sleep(seconds):
         """Sleep for a given number of seconds."""
@@ -3,25 +3,208 @@ Module that handles formatting of reports and logs.
 This makes them compatible with the backend pydantic models.
 """
 
+import json
 import math
+import shapely
 from shapely.geometry import Point, LineString
+from ._route import Route
+
+class Payload(dict):
+    """
+    Class representing a formatted entry.
+    Payloads are treated as read-only, so their JSON encoding is made once and then reused.
+    """
+    __slots__ = ('_json',)
+
+    def json(self):
+        """Return the JSON encoding of the payload."""
+        try:
+            return self._json
+        except AttributeError:
+            self._json = json.dumps(self) # pylint: disable=attribute-defined-outside-init
+            return self._json
+
+    @staticmethod
+    def dumps(entry):
+        """Return the JSON encoding of an entry, reusing it if the entry is a payload."""
+        return entry.json() if isinstance(entry, Payload) else json.dumps(entry)
 
 class Format:
-    """Class handling formatting of reports and logs."""
+    """
+    Class handling formatting of reports and logs.
+
+    For every set of keys a plan is compiled once from the formatting steps below,
+    after which an entry is formatted into a new dict in a single pass.
+    Points and short routes are written as WKT directly, exactly like shapely does.
+    Entries the plan cannot handle fall back to applying the steps one by one.
+    """
+    _plans = {}
+    _direct_path_length = 6
+
+    _log_renames = (('route', 'path_taken'),
+                    ('id', 'trip_id'),
+                    ('start_zone_id', 'start_map_zone_id'),
+                    ('start_zone_type', 'start_map_zone_type'),
+                    ('end_zone_id', 'end_map_zone_id'),
+                    ('end_zone_type', 'end_map_zone_type'))
+    _report_renames = (('position', 'last_position'),
+                       ('battery_level', 'battery_lvl'),
+                       ('id', 'bike_id'))
+    _log_removes = ('duration', 'distance')
+    _report_removes = ('timestamp', 'distance', 'bike_id')
+
+    class _Fallback(Exception):
+        """Raised when an entry has to be formatted step by step."""
 
     @staticmethod
     def log(entry):
         """Format a log entry."""
-        return Format._apply_all_formatting(entry)
+        return Format._apply(entry)
 
     @staticmethod
     def report(entry):
         """Format a report entry."""
-        return Format._apply_all_formatting(entry)
+        return Format._apply(entry)
+
+    @staticmethod
+    def _apply(entry):
+        """Format an entry using the plan compiled for its keys."""
+        try:
+            keys = tuple(entry)
+            plan = Format._plans.get(keys)
+            if plan is None:
+                plan = Format._plans[keys] = Format._compile(keys)
+            formatted = Payload()
+            for key, source, encode in plan:
+                value = entry[source]
+                formatted[key] = value if encode is None else encode(value, entry)
+            return formatted
+        except Exception: # pylint: disable=broad-exception-caught
+            # NOTE: The steps raise the same errors as before for entries that are invalid.
+            return Payload(Format._apply_all_formatting(dict(entry)))
+
+    @staticmethod
+    def _compile(keys):
+        """
+        Compile the plan for entries with the keys.
+        The plan is a list of (key, source key, encoder) in output order,
+        found by running the formatting steps on the keys instead of the values.
+        """
+        is_log = Format._is_log(keys)
+        is_report = Format._is_report(keys)
+        plan = {key: (key, []) for key in keys}
+        renames = (Format._log_renames if is_log else ()) + \
+            (Format._report_renames if is_report else ())
+        for old, new in renames:
+            if old in plan:
+                plan[new] = plan.pop(old)
+        if is_report and 'mode' in plan:
+            source, encoders = plan['mode']
+            plan['is_available'] = (source, encoders + [Format._is_sleep])
+            plan.pop('mode')
+        removes = (Format._log_removes if is_log else ()) + \
+            (Format._report_removes if is_report else ())
+        for key in removes:
+            plan.pop(key, None)
+        encoders = []
+        if is_log:
+            encoders += [('path_taken', Format._path_wkt),
+                         ('start_position', Format._point_wkt),
+                         ('end_position', Format._point_wkt)]
+        if is_report:
+            encoders += [('last_position', Format._point_wkt),
+                         ('battery_lvl', Format._ceil)]
+        for key, encoder in encoders:
+            if key in plan:
+                plan[key][1].append(encoder)
+        return [(key, source, Format._chain(encoders))
+                for key, (source, encoders) in plan.items()]
+
+    @staticmethod
+    def _chain(encoders):
+        """Combine the encoders of a key into one, or None if there are none."""
+        if not encoders:
+            return None
+        if len(encoders) == 1:
+            return encoders[0]
+        def chained(value, entry):
+            for encoder in encoders:
+                value = encoder(value, entry)
+            return value
+        return chained
+
+    @staticmethod
+    def _is_sleep(mode, _entry):
+        """Encode the mode as availability."""
+        return mode == 'sleep'
+
+    @staticmethod
+    def _ceil(battery_level, _entry):
+        """Encode the battery level as a whole number."""
+        return math.ceil(battery_level)
+
+    @staticmethod
+    def _point_wkt(position, _entry):
+        """Encode a position as a WKT point."""
+        return f"POINT({Format._position(position)})"
+
+    @staticmethod
+    def _path_wkt(path, entry):
+        """Encode a route as a WKT linestring, from the start position if there is no route."""
+        if path is not None and isinstance(path, (list, Route)):
+            if not path:
+                raise Format._Fallback()
+            if len(path) == 1:
+                position = Format._position(path[0])
+                return f"LINESTRING({position}, {position})"
+            if len(path) > Format._direct_path_length:
+                # NOTE: Writing long routes in GEOS is faster than building the string here.
+                return shapely.to_wkt(
+                    shapely.linestrings(list(path)), rounding_precision=-1).replace(" ", "", 1)
+            return f"LINESTRING({', '.join(map(Format._position, path))})"
+        position = Format._position(entry['start_position'])
+        return f"LINESTRING({position}, {position})"
+
+    @staticmethod
+    def _position(position):
+        """Return the coordinates of a 2D position as they appear in WKT."""
+        if not isinstance(position, (tuple, list)) or len(position) != 2:
+            raise Format._Fallback()
+        return f"{Format._coordinate(position[0])} {Format._coordinate(position[1])}"
+
+    @staticmethod
+    def _coordinate(value):
+        """
+        Return a coordinate as shapely writes it in WKT:
+        the shortest representation in fixed notation, rounded to at most 16 decimals.
+        """
+        if not isinstance(value, (int, float)) or isinstance(value, bool):
+            raise Format._Fallback()
+        text = repr(float(value))
+        if 'e' in text or 'n' in text:
+            raise Format._Fallback()
+        if text.endswith('.0'):
+            text = text[:-2]
+        elif len(text) - text.index('.') > 17:
+            text = Format._round(text)
+        return '0' if text == '-0' else text
+
+    @staticmethod
+    def _round(text):
+        """Round a number with more than 16 decimals to 16 decimals, half to even."""
+        sign = '-' if text[0] == '-' else ''
+        whole, fraction = text.lstrip('-').split('.')
+        tail = fraction[16:]
+        digits = int(whole + fraction[:16])
+        if tail[0] > '5' or (tail[0] == '5' and (tail[1:] or digits % 2)):
+            digits += 1
+        digits = str(digits).rjust(17, '0')
+        fraction = digits[-16:].rstrip('0')
+        return f"{sign}{digits[:-16]}.{fraction}" if fraction else f"{sign}{digits[:-16]}"
 
     @staticmethod
     def _apply_all_formatting(entry):
-        """Apply all formatting to an entry."""
+        """Apply all formatting to an entry, step by step."""
         is_log = Format._is_log(entry)
         is_report = Format._is_report(entry)
         entry = Format._rename(entry, is_log, is_report)
@@ -99,9 +282,10 @@ class Format:
         """Encode fields in an entry."""
         if is_log:
             if 'path_taken' in entry:
-                if entry['path_taken'] is not None and isinstance(entry['path_taken'], list):
+                if entry['path_taken'] is not None and \
+                        isinstance(entry['path_taken'], (list, Route)):
                     if len(entry['path_taken']) > 1:
-                        entry['path_taken'] = LineString(entry['path_taken']).wkt
+                        entry['path_taken'] = LineString(list(entry['path_taken'])).wkt
                     elif len(entry['path_taken']) == 1:
                         entry['path_taken'] = \
                             LineString([entry['path_taken'][0], entry['path_taken'][0]]).wkt
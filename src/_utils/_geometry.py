@@ -0,0 +1,68 @@
+"""
+Module for the process-wide cache of parsed zone boundaries.
+"""
+
+import sys
+import shapely
+from shapely.wkt import loads as wkt_loads
+
+class GeometryCache:
+    """
+    Class caching parsed and prepared zone boundaries for the whole process.
+
+    Entries are keyed by zone id and boundary hash,
+    so a zone whose boundary changes is parsed again instead of reusing a stale geometry.
+    """
+    _entries = {}
+    _hits = 0
+    _misses = 0
+
+    @staticmethod
+    def get(zone):
+        """Returns the parsed and prepared boundary of the zone."""
+        boundary = zone['boundary']
+        key = (zone['id'], hash(boundary))
+        entry = GeometryCache._entries.get(key)
+        if entry is not None and entry[0] == boundary:
+            GeometryCache._hits += 1
+            return entry[1]
+        GeometryCache._misses += 1
+        geometry = wkt_loads(boundary)
+        shapely.prepare(geometry)
+        GeometryCache._entries[key] = (boundary, geometry)
+        return geometry
+
+    @staticmethod
+    def invalidate(zones=None):
+        """
+        Drops cached boundaries that are superseded by the zones.
+        Drops all cached boundaries if no zones are passed.
+        """
+        if zones is None:
+            GeometryCache._entries.clear()
+            return
+        current = {(zone['id'], hash(zone['boundary'])) for zone in zones}
+        zone_ids = {zone_id for zone_id, _ in current}
+        for key in list(GeometryCache._entries):
+            if key[0] in zone_ids and key not in current:
+                del GeometryCache._entries[key]
+
+    @staticmethod
+    def clear():
+        """Drops all cached boundaries and resets the statistics."""
+        GeometryCache._entries.clear()
+        GeometryCache._hits = 0
+        GeometryCache._misses = 0
+
+    @staticmethod
+    def stats():
+        """Returns the number of entries, hits, misses and estimated size in bytes."""
+        size = 0
+        for boundary, geometry in GeometryCache._entries.values():
+            size += sys.getsizeof(boundary) + shapely.get_num_coordinates(geometry) * 16
+        return {
+            'entries': len(GeometryCache._entries),
+            'hits': GeometryCache._hits,
+            'misses': GeometryCache._misses,
+            'bytes': size,
+        }
@@ -0,0 +1,141 @@
+"""
+Module for the spatial index used to look up zones on the map.
+"""
+
+from collections import OrderedDict
+import numpy as np
+import shapely
+from shapely import STRtree
+from shapely.geometry import Point
+from ._geometry import GeometryCache
+
+class ZoneIndex:
+    """
+    Class indexing a set of zones in an STRtree for covers and nearest queries.
+
+    An index is built once per zone set and reused for as long as the same zone set
+    (the same list or tuple object) is passed to the Map helpers.
+    Zone sets are therefore treated as read-only once they have been indexed.
+    """
+    cache_size = 256
+    chunk_size = 4096
+    _cache = OrderedDict()
+
+    def __init__(self, zones):
+        self.zones = zones
+        self.boundaries = [GeometryCache.get(zone) for zone in zones]
+        self.tree = STRtree(self.boundaries)
+        self.cities = {}
+        self.segments = None
+
+    @staticmethod
+    def get(zones):
+        """Returns the index of the zones, building it if the zones have not been indexed."""
+        key = id(zones)
+        index = ZoneIndex._cache.get(key)
+        if index is not None and index.zones is zones and len(index.boundaries) == len(zones):
+            ZoneIndex._cache.move_to_end(key)
+            return index
+        index = ZoneIndex(zones)
+        ZoneIndex._cache[key] = index
+        if len(ZoneIndex._cache) > ZoneIndex.cache_size:
+            ZoneIndex._cache.popitem(last=False)
+        return index
+
+    @staticmethod
+    def clear():
+        """Clears all cached indexes."""
+        ZoneIndex._cache.clear()
+
+    def with_city_id(self, city_id):
+        """Returns the zones with the city_id, shared by every caller using this zone set."""
+        zones = self.cities.get(city_id)
+        if zones is None:
+            zones = tuple(zone for zone in self.zones if zone['city_id'] == city_id)
+            self.cities[city_id] = zones
+        return zones
+
+    def covering(self, position):
+        """Returns the first zone (in zone set order) that covers the position."""
+        point = Point(position)
+        candidates = self.tree.query(point)
+        for candidate in sorted(candidates):
+            if self.boundaries[candidate].covers(point):
+                return self.zones[candidate]
+        return None
+
+    def nearest(self, position):
+        """Returns the zone closest to the position, preferring the first zone on ties."""
+        if not self.boundaries:
+            return None
+        candidates = self.tree.query_nearest(Point(position), all_matches=True)
+        return self.zones[min(candidates)]
+
+    def covering_many(self, positions):
+        """Returns the index of the first zone covering each position, or -1 if none does."""
+        points = shapely.points(np.asarray(positions, dtype=float).reshape(-1, 2))
+        point_indices, zone_indices = self.tree.query(points, predicate='covered_by')
+        return self._first(len(points), point_indices, zone_indices)
+
+    def nearest_many(self, positions, covering=None):
+        """
+        Returns the index of the zone closest to each position, or -1 if there are no zones.
+
+        A covered position is closest to the first zone covering it.
+        For the others the distances to the zone edges are computed with NumPy,
+        and only positions with (nearly) tied zones are left to GEOS to break the tie exactly.
+        """
+        positions = np.asarray(positions, dtype=float).reshape(-1, 2)
+        if not self.boundaries:
+            return np.full(len(positions), -1, dtype=np.int64)
+        nearest = self.covering_many(positions) if covering is None else covering.copy()
+        outside = np.flatnonzero(nearest < 0)
+        tied = []
+        for start in range(0, len(outside), self.chunk_size):
+            chunk = outside[start:start + self.chunk_size]
+            distances = self._distances(positions[chunk])
+            closest = distances.min(axis=1, keepdims=True)
+            candidates = distances <= closest * (1 + 1e-9) + 1e-18
+            nearest[chunk] = candidates.argmax(axis=1)
+            tied.append(chunk[candidates.sum(axis=1) > 1])
+        tied = np.concatenate(tied) if tied else outside[:0]
+        if len(tied):
+            point_indices, zone_indices = self.tree.query_nearest(
+                shapely.points(positions[tied]), all_matches=True)
+            nearest[tied] = self._first(len(tied), point_indices, zone_indices)
+        return nearest
+
+    def _segments(self):
+        """Returns the edges of all zones as start and end points and the first edge per zone."""
+        if self.segments is None:
+            starts, ends, firsts = [], [], []
+            count = 0
+            for boundary in self.boundaries:
+                firsts.append(count)
+                for ring in shapely.get_parts(shapely.boundary(boundary)):
+                    coordinates = shapely.get_coordinates(ring)
+                    starts.append(coordinates[:-1])
+                    ends.append(coordinates[1:])
+                    count += len(coordinates) - 1
+            self.segments = (np.concatenate(starts), np.concatenate(ends), np.array(firsts))
+        return self.segments
+
+    def _distances(self, positions):
+        """Returns the squared distance from every position to every zone edge, per zone."""
+        starts, ends, firsts = self._segments()
+        edges = ends - starts
+        lengths = np.einsum('ij,ij->i', edges, edges)
+        offsets = positions[:, None, :] - starts[None, :, :]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            fractions = np.clip(np.nan_to_num(
+                np.einsum('nsj,sj->ns', offsets, edges) / lengths), 0.0, 1.0)
+        differences = offsets - fractions[:, :, None] * edges[None, :, :]
+        squared = np.einsum('nsj,nsj->ns', differences, differences)
+        return np.minimum.reduceat(squared, firsts, axis=1)
+
+    def _first(self, count, point_indices, zone_indices):
+        """Returns the lowest zone index per point, like the single-point lookups do on ties."""
+        first = np.full(count, len(self.boundaries), dtype=np.int64)
+        np.minimum.at(first, point_indices, zone_indices)
+        first[first == len(self.boundaries)] = -1
+        return first
@@ -5,12 +5,15 @@ Module for handling logic related to the map and its zones.
 
 import random
 import json
+import math
 import os
-from shapely.geometry import Point
-from shapely.wkt import loads as wkt_loads
+import numpy as np
+from ._geometry import GeometryCache
+from ._index import ZoneIndex
 
 ZONES_FILENAME = '_zones.json'
 ZONE_TYPES_FILENAME = '_zone_types.json'
+EARTH_RADIUS_IN_KM = 6371.0088
 
 class Map:
     """Class handling logic related to the map and its zones."""
@@ -19,12 +22,7 @@ class Map:
         @staticmethod
         def get(zones, position):
             """Returns the zone that covers the position."""
-            point = Point(position)
-            for zone in zones:
-                boundary = wkt_loads(zone['boundary'])
-                if boundary.covers(point):
-                    return zone
-            return None
+            return ZoneIndex.get(zones).covering(position)
 
         @staticmethod
         def has_city_id(zone, city_id):
@@ -49,7 +47,7 @@ class Map:
         @staticmethod
         def get_centroid_position(zone):
             """Returns the centroid of the zone."""
-            boundary = wkt_loads(zone['boundary'])
+            boundary = GeometryCache.get(zone)
             return (boundary.centroid.x, boundary.centroid.y)
 
         @staticmethod
@@ -97,10 +95,41 @@ class Map:
                     return []
             return zones
 
+        @staticmethod
+        def invalidate(zones=None):
+            """Invalidates cached zone geometries superseded by the zones (or all if None)."""
+            GeometryCache.invalidate(zones)
+            if zones is None:
+                ZoneIndex.clear()
+
         @staticmethod
         def get_zones_with_city_id(zones, city_id):
             """Returns the zones with the city_id."""
-            return [zone for zone in zones if Map.Zone.get_city_id(zone) == city_id]
+            return ZoneIndex.get(zones).with_city_id(city_id)
+
+        @staticmethod
+        def classify(zones, zone_types, positions):
+            """
+            Classifies an (N, 2) array of positions against the zones in one go.
+            Returns the ids of the covering zones (None where no zone covers the position),
+            the ids of the closest zones and the speed limits, each as an array of length N,
+            plus the indexes of the covering and closest zones in the zones.
+            """
+            index = ZoneIndex.get(zones)
+            covering = index.covering_many(positions)
+            closest = index.nearest_many(positions, covering)
+            zone_ids = np.array([None] + [Map.Zone.get_zone_id(zone) for zone in zones],
+                                dtype=object)
+            speed_limits = np.array(
+                [0] + [zone_types[Map.Zone.get_zone_type(zone)]['speed_limit'] for zone in zones])
+            limiting = np.where(covering >= 0, covering, closest)
+            return {
+                'zone_ids': zone_ids[covering + 1],
+                'closest_zone_ids': zone_ids[closest + 1],
+                'speed_limits': speed_limits[limiting + 1],
+                'covering': covering,
+                'closest': closest,
+            }
 
         @staticmethod
         def get_parking_zones(zones):
@@ -135,28 +164,32 @@ class Map:
         @staticmethod
         def get_closest_zone(zones, position):
             """Returns the closest zone to the position."""
-            point = Point(position)
-            closest_zone = None
-             # Initialize to infinity so that the first distance will always be shorter.
-            shortest_distance = float('inf')
-            for zone in zones:
-                boundary = wkt_loads(zone['boundary'])
-                distance = boundary.distance(point)
-                if distance < shortest_distance:
-                    shortest_distance = distance
-                    closest_zone = zone
-            return closest_zone
+            return ZoneIndex.get(zones).nearest(position)
 
         @staticmethod
         def get_distance_in_km(start_position, end_position):
-            """Returns the distance in kilometers between two positions."""
-            def _convert_to_kilometers(distance):
-                """Converts a distance to kilometers."""
-                return distance / 1000
-            start_point = Point(start_position)
-            end_point = Point(end_position)
-            distance = start_point.distance(end_point)
-            return _convert_to_kilometers(distance)
+            """
+            Returns the great-circle distance in kilometers between two (longitude, latitude)
+            positions, using the haversine formula.
+            """
+            longitude_1, latitude_1 = map(math.radians, start_position)
+            longitude_2, latitude_2 = map(math.radians, end_position)
+            haversine = math.sin((latitude_2 - latitude_1) / 2) ** 2 + \
+                math.cos(latitude_1) * math.cos(latitude_2) * \
+                math.sin((longitude_2 - longitude_1) / 2) ** 2
+            return 2 * EARTH_RADIUS_IN_KM * math.asin(min(1.0, math.sqrt(haversine)))
+
+        @staticmethod
+        def get_distances_in_km(start_positions, end_positions):
+            """Returns the great-circle distances in kilometers between arrays of positions."""
+            start_positions = np.radians(np.asarray(start_positions, dtype=float).reshape(-1, 2))
+            end_positions = np.radians(np.asarray(end_positions, dtype=float).reshape(-1, 2))
+            longitudes_1, latitudes_1 = start_positions.T
+            longitudes_2, latitudes_2 = end_positions.T
+            haversines = np.sin((latitudes_2 - latitudes_1) / 2) ** 2 + \
+                np.cos(latitudes_1) * np.cos(latitudes_2) * \
+                np.sin((longitudes_2 - longitudes_1) / 2) ** 2
+            return 2 * EARTH_RADIUS_IN_KM * np.arcsin(np.minimum(1.0, np.sqrt(haversines)))
 
         @staticmethod
         def get_position_after_minutes_travelled(
@@ -0,0 +1,93 @@
+# pylint: disable=too-few-public-methods
+"""
+Module for the registry of zone sets shared by all bikes.
+"""
+
+import json
+from types import MappingProxyType
+from ._map import Map
+
+class ZoneSet:
+    """Class representing a versioned, read-only set of zones and zone types."""
+    __slots__ = ('version', 'zones', 'zone_types', 'fingerprint', 'refs')
+
+    def __init__(self, version, zones, zone_types, fingerprint):
+        self.version = version
+        self.zones = tuple(MappingProxyType(dict(zone)) for zone in zones)
+        self.zone_types = MappingProxyType(
+            {name: MappingProxyType(dict(zone_type)) for name, zone_type in zone_types.items()})
+        self.fingerprint = fingerprint
+        self.refs = 0
+
+class ZoneRegistry:
+    """
+    Class sharing reference-counted zone sets between bikes.
+
+    Installing zones that are identical to the current zone set reuses it,
+    so every bike ends up pointing at the same zone set no matter how often it is updated.
+    """
+    _default = None
+
+    def __init__(self):
+        self.sets = {}
+        self.current = None
+        self.version = 0
+        self.sources = (None, None)
+
+    @staticmethod
+    def default():
+        """Returns the process-wide registry used by bikes created outside a hivemind."""
+        if ZoneRegistry._default is None:
+            ZoneRegistry._default = ZoneRegistry()
+        return ZoneRegistry._default
+
+    def acquire(self, zone_set=None):
+        """Returns the zone set (the current one if None) and adds a reference to it."""
+        if zone_set is None:
+            if self.current is None:
+                self.install(Map.Zones.load(), Map.ZoneTypes.load())
+            zone_set = self.current
+        zone_set.refs += 1
+        return zone_set
+
+    def release(self, zone_set):
+        """Removes a reference to the zone set and drops it once it is no longer used."""
+        if zone_set is None:
+            return
+        zone_set.refs -= 1
+        if zone_set.refs <= 0 and zone_set is not self.current:
+            self.sets.pop(zone_set.version, None)
+
+    def install(self, zones, zone_types):
+        """Makes the zones and zone types the current zone set and returns it."""
+        current = self.current
+        if current is not None and (
+                (zones is current.zones and zone_types is current.zone_types)
+                or (zones is self.sources[0] and zone_types is self.sources[1])):
+            return current
+        self.sources = (zones, zone_types)
+        fingerprint = json.dumps([list(map(dict, zones)), dict(zone_types)],
+                                 sort_keys=True, default=dict)
+        if current is not None and fingerprint == current.fingerprint:
+            return current
+        self.version += 1
+        zone_set = ZoneSet(self.version, zones, zone_types, fingerprint)
+        self.sets[zone_set.version] = zone_set
+        self.current = zone_set
+        if current is not None and current.refs <= 0:
+            self.sets.pop(current.version, None)
+        Map.Zones.invalidate(zone_set.zones)
+        return zone_set
+
+    def swap(self, zone_set, zones, zone_types):
+        """Installs the zones and zone types and moves a reference from zone_set to them."""
+        new_zone_set = self.acquire(self.install(zones, zone_types))
+        self.release(zone_set)
+        return new_zone_set
+
+    def stats(self):
+        """Returns the current version and the references held to each zone set."""
+        return {
+            'version': self.current.version if self.current else None,
+            'sets': {version: zone_set.refs for version, zone_set in self.sets.items()},
+        }
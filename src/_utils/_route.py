@@ -0,0 +1,58 @@
+"""
+Module for the append-only route of a trip.
+"""
+
+from collections.abc import Sequence
+
+class Route(Sequence):
+    """
+    Class representing an append-only sequence of positions.
+
+    All routes appended from the same start share one list of positions.
+    A route only sees the positions up to its own length,
+    so taking a snapshot is O(1) and later appends never change it.
+    """
+    __slots__ = ('_positions', '_length')
+
+    def __init__(self, positions=(), _shared=None, _length=None):
+        self._positions = _shared if _shared is not None else list(positions)
+        self._length = _length if _length is not None else len(self._positions)
+
+    def __len__(self):
+        return self._length
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return list(self)[index]
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("Route index out of range")
+        return self._positions[index]
+
+    def __iter__(self):
+        positions = self._positions
+        for index in range(self._length):
+            yield positions[index]
+
+    def __eq__(self, other):
+        if isinstance(other, (Route, list, tuple)):
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self):
+        return f"Route({list(self)!r})"
+
+    def append(self, position):
+        """Append a position to the route in place."""
+        if self._length != len(self._positions):
+            # NOTE: This route is a snapshot that has fallen behind, so it gets its own list.
+            self._positions = self._positions[:self._length]
+        self._positions.append(position)
+        self._length += 1
+
+    def snapshot(self):
+        """Return an immutable view of the route as it is now."""
+        return Route(_shared=self._positions, _length=self._length)
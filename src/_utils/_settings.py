@@ -4,6 +4,7 @@ Module centralizing all settings for the application.
 """
 
 import os
+import tempfile
 
 class Settings:
     """Class handling all settings for the application."""
@@ -90,6 +91,42 @@ class Settings:
             create = f'{endpoint}'
             get = f'{endpoint}{{id}}'
 
+    class Client:
+        """Class handling all settings for the shared HTTP client."""
+        max_connections = int(os.getenv("HTTP_MAX_CONNECTIONS", "100"))
+        max_keepalive_connections = int(os.getenv("HTTP_MAX_KEEPALIVE_CONNECTIONS", "20"))
+        keepalive_expiry = float(os.getenv("HTTP_KEEPALIVE_EXPIRY", "30.0"))
+        http2 = os.getenv("HTTP2", "False").lower() == "true"
+        timeout = 20.0
+
+    class Uplink:
+        """Class handling all settings for the batched report uplink."""
+        window = float(os.getenv("REPORT_BATCH_WINDOW", "0.1"))
+        max_batch = int(os.getenv("REPORT_BATCH_SIZE", "500"))
+        bulk_endpoint = os.getenv("REPORT_BULK_ENDPOINT")
+
+    class Scheduler:
+        """Class handling all settings for the report scheduler."""
+        resolution = float(os.getenv("SCHEDULER_RESOLUTION", "0.1"))
+        slots = 64
+        levels = 4
+
+    class Shards:
+        """Class handling all settings for running the hivemind in several processes."""
+        count = int(os.getenv("SHARDS", "1"))
+        socket_dir = os.getenv("SHARD_SOCKET_DIR", tempfile.gettempdir())
+        startup_timeout = 60.0
+
+    class Retention:
+        """Class handling all settings for retaining reports and logs in memory."""
+        reports = int(os.getenv("REPORT_RETENTION", "1000"))
+        logs = int(os.getenv("LOG_RETENTION", "1000"))
+        spill_dir = os.getenv("RETENTION_SPILL_DIR")
+
+    class Fleet:
+        """Class handling all settings for the columnar fleet state."""
+        enabled = os.getenv("FLEET_STORE", "False").lower() == "true"
+
     class Report:
         """Class handling all settings for the regular reports."""
         interval = 10
@@ -0,0 +1,61 @@
+# pylint: disable=too-many-arguments, too-many-positional-arguments, too-many-locals
+"""
+Module for planning the movement of a bike along a linestring.
+"""
+
+import numpy as np
+from ._map import Map
+
+class Trajectory:
+    """
+    Class representing the precomputed steps of a move along a linestring.
+
+    Every leg (from one vertex to the next) is split into one step per report,
+    and for each step the position, battery level and time to wait are computed up front.
+    Positions are interpolated linearly from the start of the leg and the last step
+    of a leg ends exactly on its vertex.
+    """
+    def __init__(self, positions, battery_levels, sleeps, leg_ends):
+        self.positions = positions
+        self.battery_levels = battery_levels
+        self.sleeps = sleeps
+        self.leg_ends = leg_ends
+
+    def __len__(self):
+        return len(self.sleeps)
+
+    def __iter__(self):
+        """Yields (position, battery level, seconds to sleep, is end of leg) for every step."""
+        return zip(self.positions, self.battery_levels, self.sleeps, self.leg_ends)
+
+    @staticmethod
+    def plan(start_position, linestring, speed_in_kmh, interval_in_seconds,
+             battery_level, drain_per_minute):
+        """Plans the move from the start position along the linestring."""
+        vertices = np.asarray([start_position, *linestring], dtype=float).reshape(-1, 2)
+        starts, ends = vertices[:-1], vertices[1:]
+        distances = Map.Position.get_distances_in_km(starts, ends)
+        durations_in_minutes = distances / speed_in_kmh * 60
+        interval_in_minutes = interval_in_seconds / 60
+        steps = np.maximum(np.ceil(durations_in_minutes / interval_in_minutes), 1).astype(int)
+
+        total = int(steps.sum())
+        legs = np.repeat(np.arange(len(steps)), steps)
+        first_steps = np.cumsum(steps) - steps
+        step_in_leg = np.arange(total) - np.repeat(first_steps, steps) + 1
+        travelled = speed_in_kmh * step_in_leg * interval_in_minutes / 60
+        with np.errstate(divide='ignore', invalid='ignore'):
+            fractions = np.where(distances[legs] > travelled, travelled / distances[legs], 1.0)
+        positions = starts[legs] + (ends[legs] - starts[legs]) * fractions[:, None]
+        arrived = fractions >= 1.0
+        positions[arrived] = ends[legs[arrived]]
+
+        battery_levels = np.maximum(
+            battery_level - drain_per_minute * interval_in_minutes * np.arange(1, total + 1), 0)
+        sleeps = np.repeat(durations_in_minutes / steps * 60, steps)
+        leg_ends = np.zeros(total, dtype=bool)
+        leg_ends[first_steps + steps - 1] = True
+
+        return Trajectory(
+            [tuple(position) for position in positions.tolist()],
+            battery_levels.tolist(), sleeps.tolist(), leg_ends.tolist())
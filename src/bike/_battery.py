@@ -31,19 +31,19 @@ class Battery:
 
     def drain(self, minutes, mode):
         """Drain the battery for a certain amount of time."""
-        if mode == 'usage':
-            self.level -= self.settings.drain_per_minute * \
-                minutes * self.settings.drain_factor_usage_mode
-        elif mode == 'sleep':
-            self.level -= self.settings.drain_per_minute * \
-                minutes * self.settings.drain_factor_sleep_mode
-        elif mode == 'maintenance':
-            self.level -= self.settings.drain_per_minute \
-                * minutes * self.settings.drain_factor_maintenance_mode
-        else:
-            raise Errors.invalid_mode()
+        self.level -= self.drain_rate(mode) * minutes
         self.level = max(self.level, 0)
 
+    def drain_rate(self, mode):
+        """Get the battery drain per minute in a mode."""
+        if mode == 'usage':
+            return self.settings.drain_per_minute * self.settings.drain_factor_usage_mode
+        if mode == 'sleep':
+            return self.settings.drain_per_minute * self.settings.drain_factor_sleep_mode
+        if mode == 'maintenance':
+            return self.settings.drain_per_minute * self.settings.drain_factor_maintenance_mode
+        raise Errors.invalid_mode()
+
     def is_low(self):
         """Check if the battery level is low."""
         return self.level < self.settings.minimum_battery_level_for_usage
@@ -11,8 +11,9 @@ class City:
         self.id = None
         self.zones = None
 
-    def switch(self, zones, position):
-        """Switch the city based on the position."""
-        closest_zone = Map.Position.get_closest_zone(zones, position)
+    def switch(self, zones, position, closest_zone=None):
+        """Switch the city based on the position (or the closest zone, if already known)."""
+        if closest_zone is None:
+            closest_zone = Map.Position.get_closest_zone(zones, position)
         self.id = Map.Zone.get_city_id(closest_zone)
         self.zones = Map.Zones.get_zones_with_city_id(zones, self.id)
@@ -0,0 +1,167 @@
+# pylint: disable=too-few-public-methods
+"""
+Module for the columnar state of a fleet of bikes.
+"""
+
+import numpy as np
+from .._utils._errors import Errors
+from ._battery import Battery
+from ._city import City
+from ._mode import Mode
+from ._position import Position
+from ._speed import Speed
+
+class Fleet:
+    """
+    Class storing the state of many bikes in NumPy columns (struct of arrays).
+
+    Every bike gets a row. Bikes created with a fleet read and write their battery level,
+    position, mode, speed and city id in that row through the views below,
+    so fleet-wide operations can work on whole columns at once.
+    City ids are interned, so any hashable city id can be stored.
+    """
+    modes = ('sleep', 'usage', 'maintenance')
+
+    def __init__(self, capacity=1024):
+        self.size = 0
+        self.rows = {}
+        self.cities = [None]
+        self.city_codes = {None: 0}
+        self.columns = {
+            'bike_id': np.zeros(capacity, dtype=np.int64),
+            'battery_level': np.zeros(capacity, dtype=np.float64),
+            'longitude': np.zeros(capacity, dtype=np.float64),
+            'latitude': np.zeros(capacity, dtype=np.float64),
+            'mode': np.zeros(capacity, dtype=np.int8),
+            'speed': np.zeros(capacity, dtype=np.float64),
+            'city_id': np.zeros(capacity, dtype=np.int32),
+        }
+
+    def __len__(self):
+        return self.size
+
+    def add(self, bike_id):
+        """Returns the row of the bike, adding a row if the bike is new."""
+        row = self.rows.get(bike_id)
+        if row is not None:
+            return row
+        if self.size == len(self.columns['bike_id']):
+            for name, column in self.columns.items():
+                self.columns[name] = np.concatenate([column, np.zeros_like(column)])
+        row = self.size
+        self.size += 1
+        self.rows[bike_id] = row
+        self.columns['bike_id'][row] = int(bike_id)
+        return row
+
+    def column(self, name):
+        """Returns the used part of a column."""
+        return self.columns[name][:self.size]
+
+    def mode_code(self, mode):
+        """Returns the code a mode is stored as."""
+        if mode not in Fleet.modes:
+            raise Errors.invalid_mode()
+        return Fleet.modes.index(mode)
+
+    def city_code(self, city_id):
+        """Returns the code a city id is stored as, interning it if it is new."""
+        code = self.city_codes.get(city_id)
+        if code is None:
+            code = self.city_codes[city_id] = len(self.cities)
+            self.cities.append(city_id)
+        return code
+
+    def drain(self, minutes, mode='sleep'):
+        """Drains the batteries of all bikes in the mode for a certain amount of time."""
+        battery_levels = self.column('battery_level')
+        in_mode = self.column('mode') == self.mode_code(mode)
+        battery_levels[in_mode] = np.maximum(
+            battery_levels[in_mode] - Battery().drain_rate(mode) * minutes, 0)
+
+    def snapshot(self):
+        """Returns a copy of the state of all bikes, with modes and city ids decoded."""
+        snapshot = {name: self.column(name).copy() for name in self.columns}
+        snapshot['mode'] = np.asarray(Fleet.modes, dtype=object)[snapshot['mode']]
+        snapshot['city_id'] = np.asarray(self.cities, dtype=object)[snapshot['city_id']]
+        return snapshot
+
+def _number(_fleet, value):
+    """Decodes a stored number, keeping whole speeds and the like as int."""
+    value = float(value)
+    return int(value) if value.is_integer() else value
+
+class _Column:
+    """Descriptor keeping an attribute of a view in its fleet row."""
+    def __init__(self, name, decode=None, encode=None):
+        self.name = name
+        self.decode = decode
+        self.encode = encode
+
+    def __get__(self, view, owner=None):
+        if view is None:
+            return self
+        value = view.fleet.columns[self.name][view.row]
+        return self.decode(view.fleet, value) if self.decode else float(value)
+
+    def __set__(self, view, value):
+        if self.encode:
+            value = self.encode(view.fleet, value)
+        view.fleet.columns[self.name][view.row] = value
+
+class FleetBattery(Battery):
+    """Battery whose level is stored in a fleet."""
+    level = _Column('battery_level')
+
+    def __init__(self, fleet, row, battery_level=100.0):
+        self.fleet = fleet
+        self.row = row
+        super().__init__(battery_level)
+
+class FleetPosition(Position):
+    """Position stored in a fleet."""
+    longitude = _Column('longitude')
+    latitude = _Column('latitude')
+
+    def __init__(self, fleet, row, longitude, latitude):
+        self.fleet = fleet
+        self.row = row
+        super().__init__(longitude, latitude)
+
+    @property
+    def current(self):
+        """The position as a (longitude, latitude) tuple."""
+        return (self.longitude, self.latitude)
+
+    @current.setter
+    def current(self, position):
+        self.longitude, self.latitude = position
+
+class FleetMode(Mode):
+    """Mode stored in a fleet."""
+    current = _Column('mode', decode=lambda _fleet, code: Fleet.modes[code],
+                      encode=lambda fleet, mode: fleet.mode_code(mode))
+
+    def __init__(self, fleet, row, mode='sleep'):
+        self.fleet = fleet
+        self.row = row
+        super().__init__(mode)
+
+class FleetSpeed(Speed):
+    """Speed stored in a fleet."""
+    current = _Column('speed', decode=_number)
+
+    def __init__(self, fleet, row):
+        self.fleet = fleet
+        self.row = row
+        super().__init__()
+
+class FleetCity(City):
+    """City whose id is stored in a fleet."""
+    id = _Column('city_id', decode=lambda fleet, code: fleet.cities[code],
+                 encode=lambda fleet, city_id: fleet.city_code(city_id))
+
+    def __init__(self, fleet, row):
+        self.fleet = fleet
+        self.row = row
+        super().__init__()
@@ -3,37 +3,40 @@ Module for the Logs class.
 """
 
 from .._utils._format import Format
+from .._utils._buffer import KeyedBuffer
+from .._utils._settings import Settings
 
 class Logs:
-    """Class handling the logs of the bike."""
-    def __init__(self):
-        self.logs = []
+    """
+    Class handling the logs of the bike.
+    Logs are kept by trip_id in the order the trips started.
+    Only the most recent logs are kept, older ones are spilled to disk if enabled.
+    """
+    def __init__(self, capacity=None, spill=None):
+        self.logs = KeyedBuffer(
+            capacity if capacity is not None else Settings.Retention.logs,
+            spill, Format.log)
+        self.formatted = None
 
     def add(self, trip):
         """Add a log entry."""
-        log = trip
-        if self._exists(log):
-            index = self.get_log_index(log)
-            self.logs[index] = log
-        else:
-            self.logs.append(log)
+        self.logs.put(trip["trip_id"], trip)
 
     def update(self, trip):
         """Update a log entry."""
         self.add(trip)
 
     def get(self):
-        """Return all logs."""
+        """Return all retained logs."""
         return [Format.log(log) for log in self.logs]
 
     def last(self):
-        """Return the last log."""
-        return Format.log(self.logs[-1])
-
-    def _exists(self, log):
-        """Check if a log entry exists."""
-        return any(log["trip_id"] == entry["trip_id"] for entry in self.logs)
+        """Return the last log, formatted once for as long as it is the last one."""
+        entry = self.logs[-1]
+        if self.formatted is None or self.formatted[0] is not entry:
+            self.formatted = (entry, Format.log(entry))
+        return self.formatted[1]
 
     def get_log_index(self, log):
         """Get the index of a log entry."""
-        return [log["trip_id"] == entry["trip_id"] for entry in self.logs].index(True)
+        return self.logs.index(log["trip_id"])
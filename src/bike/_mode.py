@@ -11,20 +11,28 @@ class Mode:
         self.current = mode
         self.modes = ['sleep', 'usage', 'maintenance']
         self.submodes = _Submodes()
+        self.on_change = None
         if mode not in self.modes:
             raise Errors.invalid_mode()
 
     def usage(self):
         """Set the mode to usage."""
-        self.current = 'usage'
+        self._set('usage')
 
     def maintenance(self):
         """Set the mode to maintenance."""
-        self.current = 'maintenance'
+        self._set('maintenance')
 
     def sleep(self):
         """Set the mode to sleep."""
-        self.current = 'sleep'
+        self._set('sleep')
+
+    def _set(self, mode):
+        """Set the mode and notify the on_change callback if the mode changed."""
+        changed = self.current != mode
+        self.current = mode
+        if changed and self.on_change:
+            self.on_change(mode)
 
     def is_usage(self):
         """Check if the mode is usage."""
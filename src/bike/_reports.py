@@ -5,23 +5,33 @@ Module for the Reports class.
 import math
 from .._utils._settings import Settings
 from .._utils._format import Format
+from .._utils._buffer import Buffer
 
 class Reports:
-    """Class handling the reports of the bike."""
-    def __init__(self):
-        self.reports = []
+    """
+    Class handling the reports of the bike.
+    Only the most recent reports are kept, older ones are spilled to disk if enabled.
+    """
+    def __init__(self, capacity=None, spill=None):
+        self.reports = Buffer(
+            capacity if capacity is not None else Settings.Retention.reports,
+            spill, Format.report)
+        self.formatted = None
 
     def add(self, status):
         """Add a report entry."""
         self.reports.append(status)
 
     def get(self):
-        """Return all reports."""
+        """Return all retained reports."""
         return [Format.report(report) for report in self.reports]
 
     def last(self):
-        """Return the last report."""
-        return Format.report(self.reports[-1])
+        """Return the last report, formatted once for as long as it is the last one."""
+        entry = self.reports[-1]
+        if self.formatted is None or self.formatted[0] is not entry:
+            self.formatted = (entry, Format.report(entry))
+        return self.formatted[1]
 
     @staticmethod
     def reports_needed(duration_in_minutes) -> int:
@@ -2,7 +2,6 @@
 Module for the Status class.
 """
 
-import copy
 from .._utils._clock import Clock
 
 class Status:
@@ -21,6 +20,6 @@ class Status:
         self.city_id = bike.city.id
 
     def get(self, bike):
-        """Return the status of the bike."""
+        """Return the status of the bike. All fields are immutable, so a shallow copy is enough."""
         self.update(bike)
-        return copy.deepcopy(self.__dict__)
+        return dict(self.__dict__)
@@ -1,4 +1,4 @@
-# pylint: disable=too-many-instance-attributes
+# pylint: disable=too-many-instance-attributes, too-many-arguments, too-many-positional-arguments
 """
 This module handles all the bike behavior.
 """
@@ -9,6 +9,9 @@ from .._utils._map import Map
 from .._utils._settings import Settings
 from .._utils._validate import Validate
 from .._utils._errors import Errors
+from .._utils._registry import ZoneRegistry
+from .._utils._trajectory import Trajectory
+from .._utils._buffer import Buffer
 from ._battery import Battery
 from ._position import Position
 from ._logs import Logs
@@ -18,24 +21,38 @@ from ._speed import Speed
 from ._city import City
 from ._status import Status
 from ._light import Light
+from ._fleet import FleetBattery, FleetPosition, FleetMode, FleetSpeed, FleetCity
 
 class Bike:
     """Class representing a bike."""
     def __init__(self, bike_id,
                  longitude,
-                 latitude):
+                 latitude,
+                 registry=None,
+                 fleet=None):
 
         self.bike_id = bike_id
-        self.zones = Map.Zones.load()
-        self.zone_types = Map.ZoneTypes.load()
-        self.battery = Battery()
-        self.position = Position(longitude, latitude)
-        self.logs = Logs()
-        self.reports = Reports()
-        self.mode = Mode()
-        self.speed = Speed()
+        self.registry = registry if registry else ZoneRegistry.default()
+        self.zone_set = self.registry.acquire()
+        self.zones = self.zone_set.zones
+        self.zone_types = self.zone_set.zone_types
+        self.fleet = fleet
+        if fleet is None:
+            self.battery = Battery()
+            self.position = Position(longitude, latitude)
+            self.mode = Mode()
+            self.speed = Speed()
+            self.city = City()
+        else:
+            row = fleet.add(bike_id)
+            self.battery = FleetBattery(fleet, row)
+            self.position = FleetPosition(fleet, row, longitude, latitude)
+            self.mode = FleetMode(fleet, row)
+            self.speed = FleetSpeed(fleet, row)
+            self.city = FleetCity(fleet, row)
+        self.logs = Logs(spill=Buffer.spill_path(bike_id, 'logs'))
+        self.reports = Reports(spill=Buffer.spill_path(bike_id, 'reports'))
         self.user = None
-        self.city = City()
         self.city.switch(self.zones, self.position.current)
         #if not Map.Position.is_within_zone(self.city.zones, self.position.current):
         #    self.deploy()
@@ -84,44 +101,31 @@ class Bike:
 
     async def move(self, position_or_linestring):
         """Move the bike to a new position or follow a linestring."""
-        async def _move(position):
-            position = (float(position[0]), float(position[1]))
-            speed_in_kmh = self.speed.default
-            distance_in_km = Map.Position.get_distance_in_km(self.position.current, position)
-            total_duration_in_minutes = Clock.get_duration_in_minutes(distance_in_km, speed_in_kmh)
-            total_reports = Reports.reports_needed(total_duration_in_minutes)
-            for report_index in range(total_reports):
-                report_interval_in_minutes = Clock.convert_seconds_to_minutes(
-                    Settings.Report.interval)
-                minutes_travelled = report_interval_in_minutes * (report_index + 1)
-                self.battery.drain(report_interval_in_minutes, self.mode.current)
-                current_position = Map.Position.get_position_after_minutes_travelled(
-                    self.position.current, position, minutes_travelled, speed_in_kmh)
-                self.position.change(current_position[0], current_position[1])
-                self.speed.limit(self.city.zones, self.zone_types, self.position.current)
-                self.report()
-                leg_duration_in_seconds = Clock.get_leg_duration_in_seconds(
-                    total_duration_in_minutes, total_reports)
-                await Clock.sleep(leg_duration_in_seconds)
-            self.user.trip.add_movement(self.position.current)
-            self.logs.update(self.user.trip.get())
-            self.check()
-            self.light.set(self.mode.current)
-            self.mode.submodes.usage.moving = False
         if self.mode.is_locked():
             raise Errors.already_locked()
         if Position.is_position(position_or_linestring):
-            self.mode.submodes.usage.moving = True
-            await _move(position_or_linestring)
-            self.mode.submodes.usage.moving = False
+            linestring = [position_or_linestring]
         elif Validate.is_linestring(position_or_linestring):
-            self.mode.submodes.usage.moving = True
-            for position in position_or_linestring:
-                await _move(position)
-            self.mode.submodes.usage.moving = False
-        elif not Position.is_position(position_or_linestring) \
-            or not Validate.is_linestring(position_or_linestring):
+            linestring = position_or_linestring
+        else:
             Validate.position_or_linestring(position_or_linestring)
+            return
+        trajectory = Trajectory.plan(
+            self.position.current, linestring, self.speed.default, Settings.Report.interval,
+            self.battery.level, self.battery.drain_rate(self.mode.current))
+        self.mode.submodes.usage.moving = True
+        for position, battery_level, seconds, is_leg_end in trajectory:
+            self.battery.level = battery_level
+            self.position.change(position[0], position[1])
+            self.speed.limit(self.city.zones, self.zone_types, self.position.current)
+            self.report()
+            await Clock.sleep(seconds)
+            if is_leg_end:
+                self.user.trip.add_movement(self.position.current)
+                self.logs.update(self.user.trip.get())
+                self.check()
+                self.light.set(self.mode.current)
+        self.mode.submodes.usage.moving = False
 
     def relocate(self, position, ignore_zone=True):
         """Relocate the bike to a new position without draining the battery."""
@@ -189,11 +193,18 @@ class Bike:
         """Add a report."""
         self.reports.add(self.status.get(self))
 
-    def update(self, zones=None, zone_types=None):
-        """Update the bike's zones and zone types."""
-        self.zones = zones if zones else self.zones
-        self.zone_types = zone_types if zone_types else self.zone_types
-        self.city.switch(self.zones, self.position.current)
+    def update(self, zones=None, zone_types=None, closest_zone=None):
+        """
+        Update the bike's zones and zone types.
+        The closest zone can be passed in when it was already looked up for many bikes at once.
+        """
+        self.zone_set = self.registry.swap(
+            self.zone_set,
+            zones if zones else self.zones,
+            zone_types if zone_types else self.zone_types)
+        self.zones = self.zone_set.zones
+        self.zone_types = self.zone_set.zone_types
+        self.city.switch(self.zones, self.position.current, closest_zone)
 
     def is_moving_or_charging(self):
         """Check if the bike is moving or charging."""
@@ -0,0 +1,51 @@
+# pylint: disable=too-few-public-methods
+"""
+This module handles the HTTP client shared by all outgoing communication.
+"""
+
+import asyncio
+import importlib.util
+import logging
+import httpx
+from .._utils._settings import Settings
+
+class Client:
+    """
+    Class handling the pooled, long-lived HTTP client used for all outgoing traffic.
+    Connections are kept alive and reused across requests and bikes.
+    """
+    _client = None
+    _loop = None
+
+    @staticmethod
+    def get() -> httpx.AsyncClient:
+        """Returns the shared client, creating it for the running event loop if needed."""
+        loop = asyncio.get_running_loop()
+        if Client._client is None or Client._client.is_closed or Client._loop is not loop:
+            Client._client = Client._create()
+            Client._loop = loop
+        return Client._client
+
+    @staticmethod
+    async def close():
+        """Closes the shared client and its connections."""
+        client = Client._client
+        Client._client = None
+        Client._loop = None
+        if client is not None and not client.is_closed:
+            await client.aclose()
+
+    @staticmethod
+    def _create() -> httpx.AsyncClient:
+        """Creates a client configured from the settings."""
+        settings = Settings.Client
+        limits = httpx.Limits(
+            max_connections=settings.max_connections,
+            max_keepalive_connections=settings.max_keepalive_connections,
+            keepalive_expiry=settings.keepalive_expiry)
+        http2 = settings.http2
+        if http2 and importlib.util.find_spec("h2") is None:
+            logging.getLogger(__name__).warning(
+                "HTTP2 is enabled but the h2 package is not installed. Using HTTP/1.1.")
+            http2 = False
+        return httpx.AsyncClient(limits=limits, http2=http2, timeout=settings.timeout)
@@ -2,18 +2,26 @@
 This module handles all the incoming requests to the bike hivemind API.
 """
 
+from contextlib import asynccontextmanager
 from typing import Union, Optional
 import asyncio
 from pydantic import BaseModel
 from fastapi import FastAPI, HTTPException, Depends, Query, Request, BackgroundTasks
 from .brain import Brain
 from .hivemind import Hivemind
+from ._client import Client
 from .._utils._errors import (AlreadyUnlockedError,
                               AlreadyLockedError,
                               InvalidPositionError,
                               MovingOrChargingError)
 
-app = FastAPI()
+@asynccontextmanager
+async def lifespan(_app: FastAPI):
+    """Closes the shared HTTP client when the API shuts down."""
+    yield
+    await Client.close()
+
+app = FastAPI(lifespan=lifespan)
 
 def get_hivemind(request: Request) -> Hivemind:
     """Dependency to retrieve the Hivemind instance from the FastAPI app's state."""
@@ -195,13 +203,26 @@ class UpdateRequest(BaseModel):
     """Request model for updating the bike's zones and zone types."""
 
 @app.post("/update")
-async def update(brain = Depends(get_brain)): # request: UpdateRequest
+async def update(
+    brain = Depends(get_brain), # request: UpdateRequest
+    fleet: bool = Query(
+        False, description="Update all bikes that are not moving or charging."),
+    http_request: Request = None
+    ):
     """Handling incoming request to update the bike's zones and zone types."""
+    if fleet:
+        hivemind = get_hivemind(http_request)
+        try:
+            return {"message": "Zones and zone types updated",
+                    "data": await hivemind.update()}
+        except Exception as e:
+            raise HTTPException(
+                status_code=500, detail=f"Internal Server Error. Details: {e}") from e
     try:
         if brain.bike.is_moving_or_charging():
             raise MovingOrChargingError()
-        zones = await brain.request_zones()
-        zone_types = await brain.request_zone_types()
+        zones, zone_types = await asyncio.gather(
+            brain.request_zones(), brain.request_zone_types())
         brain.bike.update(zones=zones, zone_types=zone_types)
         return {"message": "Zones and zone types updated"}
     except MovingOrChargingError as e:
@@ -4,6 +4,7 @@ This module handles the initialization of the bike hivemind.
 """
 
 import httpx
+from ._client import Client
 from .._utils._settings import Settings
 
 def _url(url, endpoint):
@@ -27,18 +28,18 @@ class Initialize:
         """Loads bikes from the backend."""
         if self.bikes is None:
             url = _url(self.url, self.endpoints.Bikes.get_all())
-            async with httpx.AsyncClient() as client:
-                try:
-                    response = await client.get(
-                        url,
-                        params={"limit": Settings.Endpoints.bike_limit},
-                        headers=self.headers, timeout=20.0
-                        )
-                    response.raise_for_status()
-                    self.bikes = response.json().get('data', [])
-                    print(f'Bikes loaded. First five bikes: {self.bikes[0:5]}')
-                except httpx.RequestError as e:
-                    raise httpx.RequestError(f"Failed to request bikes: {e}") from e
+            client = Client.get()
+            try:
+                response = await client.get(
+                    url,
+                    params={"limit": Settings.Endpoints.bike_limit},
+                    headers=self.headers, timeout=20.0
+                    )
+                response.raise_for_status()
+                self.bikes = response.json().get('data', [])
+                print(f'Bikes loaded. First five bikes: {self.bikes[0:5]}')
+            except httpx.RequestError as e:
+                raise httpx.RequestError(f"Failed to request bikes: {e}") from e
         else:
             print(f'Bikes already loaded. First five bikes: {self.bikes[0:5]}')
 
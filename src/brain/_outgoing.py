@@ -3,10 +3,12 @@
 This module handles outgoing communication to the backend.
 """
 
-import json
+import asyncio
 from typing import Union, List, Dict
 import httpx
+from ._client import Client
 from .._utils._settings import Settings
+from .._utils._format import Payload
 
 def _url(url, endpoint):
     """Concatenates the url and endpoint."""
@@ -28,33 +30,70 @@ class Outgoing:
         self.request = Request(self.url, self.headers)
 
 class Request():
-    """Class handling requests to the backend."""
+    """
+    Class handling requests to the backend.
+
+    Zone requests are shared by every Request in the process:
+    concurrent requests for the same resource wait for a single in-flight fetch,
+    and repeat requests are sent as conditional requests (ETag / Last-Modified)
+    so an unchanged resource is answered with 304 and served from the cache.
+    """
+    _inflight = {}
+    _cache = {}
+
     def __init__(self, url, headers):
         self.endpoints = Settings.Endpoints()
         self.url = url
         self.headers = headers
 
+    @staticmethod
+    def clear_cache():
+        """Clears the cached zone responses."""
+        Request._cache.clear()
+
     async def zones(self):
         """Requests all zones from the backend."""
-        url = _url(self.url, self.endpoints.Zones.get_all)
-        async with httpx.AsyncClient() as client:
-            try:
-                response = await client.get(url, headers=self.headers, timeout=20.0)
-                response.raise_for_status()
-                return response.json()
-            except httpx.RequestError as e:
-                print(f"Failed to get zones {e}")
+        return await self._get_shared(self.endpoints.Zones.get_all, "Failed to get zones")
 
     async def zone_types(self):
         """Requests all zone types from the backend."""
-        url = _url(self.url, self.endpoints.Zones.get_types)
-        async with httpx.AsyncClient() as client:
-            try:
-                response = await client.get(url, headers=self.headers, timeout=20.0)
-                response.raise_for_status()
-                return response.json()
-            except httpx.RequestError as e:
-                print(f"Failed to get zone types. {e}")
+        return await self._get_shared(self.endpoints.Zones.get_types, "Failed to get zone types.")
+
+    async def _get_shared(self, endpoint, error_message):
+        """Joins the in-flight request for the endpoint or starts a new one."""
+        url = _url(self.url, endpoint)
+        key = (url, self.headers.get('Authorization'))
+        task = Request._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._get_conditional(url, key, error_message))
+            Request._inflight[key] = task
+            task.add_done_callback(lambda _: Request._inflight.pop(key, None))
+        return await asyncio.shield(task)
+
+    async def _get_conditional(self, url, key, error_message):
+        """Requests the url, revalidating a cached response if there is one."""
+        headers = dict(self.headers)
+        cached = Request._cache.get(key)
+        if cached:
+            etag, last_modified, _ = cached
+            if etag:
+                headers['If-None-Match'] = etag
+            if last_modified:
+                headers['If-Modified-Since'] = last_modified
+        client = Client.get()
+        try:
+            response = await client.get(url, headers=headers, timeout=20.0)
+            if cached and response.status_code == 304:
+                return cached[2]
+            response.raise_for_status()
+            data = response.json()
+            etag = response.headers.get('ETag')
+            last_modified = response.headers.get('Last-Modified')
+            if etag or last_modified:
+                Request._cache[key] = (etag, last_modified, data)
+            return data
+        except httpx.RequestError as e:
+            print(f"{error_message} {e}")
 
 class Logs():
     """Class handling logs."""
@@ -68,30 +107,30 @@ class Logs():
         url = _url(self.url, self.endpoints.Trips.start)
         if isinstance(logs, dict):
             logs = [logs]
-        async with httpx.AsyncClient() as client:
-            try:
-                for log in logs:
-                    response = await client.post(
-                        url, headers=self.headers,
-                        data=json.dumps(log), timeout=20.0)
-                    response.raise_for_status()
-            except httpx.RequestError as e:
-                print(f"Failed to send log. {e}")
+        client = Client.get()
+        try:
+            for log in logs:
+                response = await client.post(
+                    url, headers=self.headers,
+                    data=Payload.dumps(log), timeout=20.0)
+                response.raise_for_status()
+        except httpx.RequestError as e:
+            print(f"Failed to send log. {e}")
 
     async def update(self, logs: Union[Dict, List[Dict]]):
         """Updates logs in the backend."""
         url = _url(self.url, self.endpoints.Trips.update)
         if isinstance(logs, dict):
             logs = [logs]
-        async with httpx.AsyncClient() as client:
-            try:
-                for log in logs:
-                    response = await client.patch(
-                        url, headers=self.headers,
-                        data=json.dumps(log), timeout=20.0)
-                    response.raise_for_status()
-            except httpx.RequestError as e:
-                print(f"Failed to send log. {e}")
+        client = Client.get()
+        try:
+            for log in logs:
+                response = await client.patch(
+                    url, headers=self.headers,
+                    data=Payload.dumps(log), timeout=20.0)
+                response.raise_for_status()
+        except httpx.RequestError as e:
+            print(f"Failed to send log. {e}")
 
 class Reports():
     """Class handling reports."""
@@ -106,12 +145,12 @@ class Reports():
         url = _url(self.url, self.endpoints.Bikes.update(self.bike_id))
         if isinstance(reports, dict):
             reports = [reports]
-        async with httpx.AsyncClient() as client:
-            try:
-                for report in reports:
-                    response = await client.patch(
-                        url, headers=self.headers,
-                        data=json.dumps(report), timeout=20.0)
-                    response.raise_for_status()
-            except httpx.RequestError as e:
-                print(f"Failed to send report. {e}")
+        client = Client.get()
+        try:
+            for report in reports:
+                response = await client.patch(
+                    url, headers=self.headers,
+                    data=Payload.dumps(report), timeout=20.0)
+                response.raise_for_status()
+        except httpx.RequestError as e:
+            print(f"Failed to send report. {e}")
@@ -0,0 +1,98 @@
+"""
+This module handles the front door of a sharded hivemind.
+Every request is forwarded to the shard process that owns the target bike.
+"""
+
+from contextlib import asynccontextmanager
+import asyncio
+from typing import List, Optional
+import httpx
+from fastapi import FastAPI, HTTPException, Request, Response
+from ._shard import Shards
+
+class Router:
+    """Class holding one client per shard and mapping bikes to shards."""
+
+    def __init__(self, bike_ids: List[int], count: int, transports: Optional[list] = None):
+        self.count = count
+        self.lowest = min(bike_ids) if bike_ids else 0
+        self.owners = sorted({Shards.owner(bike_id, count) for bike_id in bike_ids})
+        self.clients = [
+            httpx.AsyncClient(
+                transport=(transports[index] if transports
+                           else httpx.AsyncHTTPTransport(uds=Shards.socket_path(index))),
+                base_url="http://shard",
+                timeout=20.0)
+            for index in range(count)]
+
+    def client(self, bike_id: Optional[str]) -> httpx.AsyncClient:
+        """Returns the client of the shard owning the bike (the lowest bike_id if None)."""
+        try:
+            owner = Shards.owner(int(bike_id) if bike_id else self.lowest, self.count)
+        except ValueError:
+            owner = 0 # NOTE: The shard answers with the usual validation error.
+        return self.clients[owner]
+
+    async def close(self):
+        """Closes the clients of all shards."""
+        await asyncio.gather(*(client.aclose() for client in self.clients))
+
+@asynccontextmanager
+async def lifespan(router_app: FastAPI):
+    """Closes the shard clients when the API shuts down."""
+    yield
+    router = getattr(router_app.state, 'router', None)
+    if router:
+        await router.close()
+
+app = FastAPI(lifespan=lifespan)
+
+def get_router(request: Request) -> Router:
+    """Retrieves the Router instance from the FastAPI app's state."""
+    router = getattr(request.app.state, 'router', None)
+    if not router:
+        raise HTTPException(status_code=500, detail="Router not initialized.")
+    return router
+
+async def _forward(client: httpx.AsyncClient, request: Request, path: str,
+                   params=None) -> httpx.Response:
+    """Forwards the request to a shard."""
+    headers = {}
+    if 'content-type' in request.headers:
+        headers['content-type'] = request.headers['content-type']
+    try:
+        return await client.request(
+            request.method,
+            f"/{path}",
+            params=request.query_params if params is None else params,
+            content=await request.body(),
+            headers=headers)
+    except httpx.RequestError as e:
+        raise HTTPException(status_code=503, detail=f"Shard unavailable. Details: {e}") from e
+
+@app.api_route("/update", methods=["POST"])
+async def update(request: Request):
+    """Forwards an update to the owning shard, or to every shard for a fleet update."""
+    router = get_router(request)
+    if request.query_params.get('fleet', '').lower() not in ('1', 'true', 'yes', 'on'):
+        return await forward("update", request)
+    # NOTE: Only shards that own bikes take part, and none of them is asked for a specific bike.
+    responses = await asyncio.gather(
+        *(_forward(router.clients[owner], request, "update", params={'fleet': 'true'})
+          for owner in router.owners))
+    data = {"updated": 0, "skipped": 0}
+    for response in responses:
+        if response.status_code != 200:
+            return Response(response.content, status_code=response.status_code,
+                            media_type=response.headers.get('content-type'))
+        for key, value in response.json().get('data', {}).items():
+            data[key] = data.get(key, 0) + value
+    return {"message": "Zones and zone types updated", "data": data}
+
+@app.api_route("/{path:path}", methods=["GET", "POST", "PUT", "DELETE"])
+async def forward(path: str, request: Request):
+    """Forwards the request to the shard owning the bike in the bike_id query parameter."""
+    router = get_router(request)
+    response = await _forward(router.client(request.query_params.get('bike_id')), request, path)
+    return Response(response.content, status_code=response.status_code,
+                    media_type=response.headers.get('content-type'))
@@ -0,0 +1,140 @@
+"""
+This module handles the scheduling of reports for all bikes in the hivemind.
+"""
+
+import asyncio
+import logging
+import math
+from .._utils._clock import Clock
+from .._utils._settings import Settings
+
+class TimerWheel:
+    """
+    Class representing a hierarchical timing wheel.
+
+    Level 0 has one slot per tick and every higher level has slots
+    that are `slots` times wider than the level below.
+    Timers on higher levels cascade down as their slot comes up,
+    so advancing one tick only touches the timers that are due or cascading.
+    """
+    def __init__(self, slots=64, levels=4):
+        self.slots = slots
+        self.levels = levels
+        self.wheels = [[{} for _ in range(slots)] for _ in range(levels)]
+        self.timers = {}
+        self.tick = 0
+
+    def __len__(self):
+        return len(self.timers)
+
+    def __contains__(self, key):
+        return key in self.timers
+
+    def schedule(self, key, deadline):
+        """Schedule (or reschedule) the key to be due at the deadline tick."""
+        self.cancel(key)
+        self._insert(key, max(deadline, self.tick + 1))
+
+    def cancel(self, key):
+        """Cancel the timer of the key, if it has one."""
+        position = self.timers.pop(key, None)
+        if position is not None:
+            level, slot = position
+            del self.wheels[level][slot][key]
+
+    def advance(self, tick):
+        """Advance the wheel to the tick and return the keys that became due, in order."""
+        due = []
+        while self.tick < tick:
+            self.tick += 1
+            for level in range(self.levels - 1, 0, -1):
+                span = self.slots ** level
+                if self.tick % span == 0:
+                    self._cascade(level, (self.tick // span) % self.slots)
+            slot = self.wheels[0][self.tick % self.slots]
+            self.wheels[0][self.tick % self.slots] = {}
+            for key, deadline in slot.items():
+                del self.timers[key]
+                if deadline <= self.tick:
+                    due.append(key)
+                else:
+                    self._insert(key, deadline)
+        return due
+
+    def _cascade(self, level, slot):
+        """Move the timers in a slot of a higher level down to the levels below."""
+        timers = self.wheels[level][slot]
+        self.wheels[level][slot] = {}
+        for key, deadline in timers.items():
+            del self.timers[key]
+            self._insert(key, deadline)
+
+    def _insert(self, key, deadline):
+        """Insert the key on the lowest level whose range covers the deadline."""
+        delta = deadline - self.tick
+        level = 0
+        while level < self.levels - 1 and delta >= self.slots ** (level + 1):
+            level += 1
+        slot = (deadline // self.slots ** level) % self.slots
+        self.wheels[level][slot][key] = deadline
+        self.timers[key] = (level, slot)
+
+class Scheduler:
+    """
+    Class firing the reports of all bikes in the hivemind from a single task.
+    Each bike is rescheduled according to its mode after every report and on mode changes.
+    """
+    def __init__(self, resolution=None):
+        self.resolution = resolution if resolution else Settings.Scheduler.resolution
+        self.wheel = TimerWheel(Settings.Scheduler.slots, Settings.Scheduler.levels)
+        self.brains = {}
+        self.tasks = set()
+        self.start = Clock.monotonic()
+        self.running = True
+        self.logger = logging.getLogger(__name__)
+
+    def add(self, brain):
+        """Add a brain and schedule its first report."""
+        self.brains[brain.bike.bike_id] = brain
+        brain.scheduler = self
+        self.reschedule(brain.bike.bike_id)
+
+    def remove(self, bike_id):
+        """Remove a brain and cancel its report."""
+        brain = self.brains.pop(bike_id, None)
+        if brain is not None:
+            brain.scheduler = None
+        self.wheel.cancel(bike_id)
+
+    def reschedule(self, bike_id):
+        """Schedule the next report of a bike based on its current mode."""
+        brain = self.brains.get(bike_id)
+        if brain is None:
+            return
+        deadline = Clock.monotonic() + brain.report_delay()
+        self.wheel.schedule(bike_id, math.ceil((deadline - self.start) / self.resolution))
+
+    async def run(self):
+        """Fire due reports until terminated."""
+        while self.running:
+            tick = int((Clock.monotonic() - self.start) / self.resolution)
+            for bike_id in self.wheel.advance(tick):
+                task = asyncio.ensure_future(self._fire(self.brains[bike_id]))
+                self.tasks.add(task)
+                task.add_done_callback(self.tasks.discard)
+            await Clock.sleep(self.resolution)
+
+    async def terminate(self):
+        """Stop firing reports."""
+        self.running = False
+
+    async def _fire(self, brain):
+        """Send the report of a brain and schedule its next one."""
+        try:
+            await brain.send_report()
+        except Exception as e: # pylint: disable=broad-exception-caught
+            self.logger.error("Error while sending report for bike %s: %s",
+                              brain.bike.bike_id, e)
+        finally:
+            if brain.bike.bike_id not in self.wheel:
+                self.reschedule(brain.bike.bike_id)
@@ -0,0 +1,95 @@
+"""
+This module handles running the hivemind as several shard processes.
+Bikes are partitioned over the shards by bike_id and every shard runs its own hivemind.
+"""
+
+import asyncio
+import multiprocessing
+import os
+from typing import List, Tuple
+import uvicorn
+from ._incoming import app
+from .hivemind import Hivemind
+from .._utils._clock import Clock
+from .._utils._settings import Settings
+
+class Shards:
+    """Class handling the partitioning of bikes over shard processes."""
+
+    @staticmethod
+    def owner(bike_id: int, count: int) -> int:
+        """Returns the index of the shard that owns the bike."""
+        return bike_id % count
+
+    @staticmethod
+    def partition(bike_ids: List[int],
+                  positions: List[Tuple[float, float]],
+                  count: int) -> List[Tuple[List[int], List[Tuple[float, float]]]]:
+        """Partitions the bikes and their positions over the shards."""
+        shards = [([], []) for _ in range(count)]
+        for bike_id, position in zip(bike_ids, positions):
+            shard_bike_ids, shard_positions = shards[Shards.owner(bike_id, count)]
+            shard_bike_ids.append(bike_id)
+            shard_positions.append(position)
+        return shards
+
+    @staticmethod
+    def socket_path(index: int) -> str:
+        """Returns the path of the unix socket the shard listens on."""
+        return os.path.join(Settings.Shards.socket_dir, f'scooty-doo-shard-{index}.sock')
+
+    @staticmethod
+    def start(bike_ids, positions, token, count) -> List[multiprocessing.Process]:
+        """Starts one process per shard that owns at least one bike."""
+        context = multiprocessing.get_context('spawn')
+        processes = []
+        for index, (shard_bike_ids, shard_positions) in enumerate(
+                Shards.partition(bike_ids, positions, count)):
+            if not shard_bike_ids:
+                continue
+            if os.path.exists(Shards.socket_path(index)):
+                os.remove(Shards.socket_path(index))
+            process = context.Process(
+                target=Shards.serve,
+                args=(index, shard_bike_ids, shard_positions, token),
+                name=f'shard-{index}', daemon=True)
+            process.start()
+            processes.append(process)
+        return processes
+
+    @staticmethod
+    def stop(processes: List[multiprocessing.Process]):
+        """Stops the shard processes."""
+        for process in processes:
+            process.terminate()
+        for process in processes:
+            process.join()
+
+    @staticmethod
+    async def wait(indices: List[int], timeout=None):
+        """Waits until every shard in indices is listening on its socket."""
+        timeout = timeout if timeout is not None else Settings.Shards.startup_timeout
+        deadline = Clock.monotonic() + timeout
+        paths = [Shards.socket_path(index) for index in indices]
+        while not all(os.path.exists(path) for path in paths):
+            if Clock.monotonic() > deadline:
+                raise TimeoutError("Shards did not start in time.")
+            await Clock.sleep(0.1)
+
+    @staticmethod
+    def serve(index, bike_ids, positions, token): # pragma: no cover
+        """Entry point of a shard process."""
+        asyncio.run(Shards._serve(index, bike_ids, positions, token))
+
+    @staticmethod
+    async def _serve(index, bike_ids, positions, token): # pragma: no cover
+        """Runs the hivemind of a shard and serves the API on its socket."""
+        path = Shards.socket_path(index)
+        if os.path.exists(path):
+            os.remove(path)
+        hivemind = await Hivemind.create(bike_ids, positions, token)
+        app.state.hivemind = hivemind
+        print(f"Shard {index}: number of bikes: {len(bike_ids)}")
+        config = uvicorn.Config(app, uds=path, log_level="warning", loop="asyncio", lifespan="on")
+        server = uvicorn.Server(config)
+        await asyncio.gather(hivemind.scheduler.run(), server.serve())
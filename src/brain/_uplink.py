@@ -0,0 +1,126 @@
+# pylint: disable=too-many-instance-attributes
+"""
+This module handles the batched uplink of reports from all bikes to the backend.
+"""
+
+import asyncio
+import json
+import logging
+import httpx
+from ._client import Client
+from .._utils._settings import Settings
+from .._utils._format import Payload
+
+def _url(url, endpoint):
+    """Concatenates the url and endpoint."""
+    return f'{url.rstrip("/")}/{endpoint.lstrip("/")}'
+
+def _with_id(report, bike_id):
+    """
+    Returns the JSON encoding of the report with the bike_id added as id.
+    The encoding of a payload is reused by appending the id to it.
+    """
+    if isinstance(report, Payload) and report and 'id' not in report:
+        return f'{report.json()[:-1]}, "id": {json.dumps(bike_id)}}}'
+    return json.dumps(dict(report, id=bike_id))
+
+class Uplink:
+    """
+    Class collecting reports from all brains and flushing them in batches.
+
+    Reports are collected for a short window (or until a batch is full)
+    and sent as one request to the bulk endpoint. If no bulk endpoint is configured,
+    or the backend does not have one, the batch is sent as concurrent single PATCHes.
+    """
+    def __init__(self, token: str, window=None, max_batch=None, bulk_endpoint=None):
+        self.endpoints = Settings.Endpoints()
+        self.url = self.endpoints.backend_url
+        self.headers = {
+            'Content-Type': 'application/json',
+            'Authorization': f'Bearer {token}',
+        }
+        self.window = window if window is not None else Settings.Uplink.window
+        self.max_batch = max_batch if max_batch else Settings.Uplink.max_batch
+        self.bulk_endpoint = bulk_endpoint if bulk_endpoint else Settings.Uplink.bulk_endpoint
+        self.pending = []
+        self.timer = None
+        self.metrics = {'batches': 0, 'reports': 0, 'bulk_requests': 0, 'single_requests': 0}
+        self.logger = logging.getLogger(__name__)
+
+    async def send(self, bike_id: int, report: dict):
+        """Queues a report and waits until the batch it is part of has been sent."""
+        future = asyncio.get_running_loop().create_future()
+        self.pending.append((bike_id, report, future))
+        if len(self.pending) >= self.max_batch:
+            self.flush()
+        elif self.timer is None:
+            self.timer = asyncio.get_running_loop().call_later(self.window, self.flush)
+        return await future
+
+    def flush(self):
+        """Sends all queued reports as one batch."""
+        if self.timer is not None:
+            self.timer.cancel()
+            self.timer = None
+        batch, self.pending = self.pending, []
+        if batch:
+            asyncio.ensure_future(self._send_batch(batch))
+
+    def stats(self):
+        """Returns the uplink metrics, including the average batch fill."""
+        batches = self.metrics['batches']
+        fill = self.metrics['reports'] / (batches * self.max_batch) if batches else 0.0
+        return dict(self.metrics, fill=fill)
+
+    async def _send_batch(self, batch):
+        """Sends a batch and resolves the futures of its reports."""
+        self.metrics['batches'] += 1
+        self.metrics['reports'] += len(batch)
+        try:
+            if self.bulk_endpoint and await self._send_bulk(batch):
+                results = [None] * len(batch)
+            else:
+                results = await asyncio.gather(
+                    *(self._send_single(bike_id, report) for bike_id, report, _ in batch),
+                    return_exceptions=True)
+        except Exception as e: # pylint: disable=broad-exception-caught
+            results = [e] * len(batch)
+        for (_, _, future), result in zip(batch, results):
+            if future.done():
+                continue
+            if isinstance(result, Exception):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+    async def _send_bulk(self, batch):
+        """
+        Sends the batch to the bulk endpoint.
+        Returns False (and stops using the bulk endpoint) if the backend does not have one.
+        """
+        self.metrics['bulk_requests'] += 1
+        url = _url(self.url, self.bulk_endpoint)
+        payload = f"[{', '.join(_with_id(report, bike_id) for bike_id, report, _ in batch)}]"
+        try:
+            response = await Client.get().patch(
+                url, headers=self.headers, data=payload, timeout=20.0)
+        except httpx.RequestError as e:
+            print(f"Failed to send reports. {e}")
+            return True
+        if response.status_code in (404, 405):
+            self.logger.warning("Bulk endpoint %s not found. Sending single reports.", url)
+            self.bulk_endpoint = None
+            return False
+        response.raise_for_status()
+        return True
+
+    async def _send_single(self, bike_id, report):
+        """Sends one report to the bike's endpoint."""
+        self.metrics['single_requests'] += 1
+        url = _url(self.url, self.endpoints.Bikes.update(bike_id))
+        try:
+            response = await Client.get().patch(
+                url, headers=self.headers, data=Payload.dumps(report), timeout=20.0)
+            response.raise_for_status()
+        except httpx.RequestError as e:
+            print(f"Failed to send report. {e}")
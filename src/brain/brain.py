@@ -1,3 +1,4 @@
+# pylint: disable=too-many-arguments, too-many-positional-arguments
 """
 This module adds incoming and outgoing communication to the bike object.
 This enables it to communicate with the backend.
@@ -19,13 +20,19 @@ class Brain:
     def __init__(self, bike_id,
                  longitude=None,
                  latitude=None,
-                 token=None
+                 token=None,
+                 registry=None,
+                 uplink=None,
+                 fleet=None
                  ):
 
-        self.bike = Bike(bike_id, longitude, latitude)
+        self.bike = Bike(bike_id, longitude, latitude, registry, fleet)
         self.outgoing = Outgoing(token, bike_id)
+        self.uplink = uplink
+        self.scheduler = None
         self.running = True
         self.logger = logging.getLogger(__name__)
+        self.bike.mode.on_change = self._mode_changed
 
     async def initialize(self):
         """Initialize the bike brain with zones and zone types."""
@@ -43,10 +50,7 @@ class Brain:
     async def run(self):
         """Run the bike brain."""
         while self.running:
-            report_interval = getattr(Settings.Report, f'interval_{self.bike.mode.current}')
-            delay = randint(report_interval, 1000)
-            wait_time = report_interval + (delay/1000)
-            await Clock.sleep(wait_time)
+            await Clock.sleep(self.report_delay())
             try:
                 await self.send_report()
             except httpx.HTTPStatusError as e:
@@ -58,6 +62,17 @@ class Brain:
                 print(f"Unexpected error while sending report: {e}")
                 raise
 
+    def report_delay(self):
+        """Return the delay until the next report, based on the mode of the bike."""
+        report_interval = getattr(Settings.Report, f'interval_{self.bike.mode.current}')
+        delay = randint(report_interval, 1000)
+        return report_interval + (delay/1000)
+
+    def _mode_changed(self, _mode):
+        """Reschedule the next report when the mode of the bike changes."""
+        if self.scheduler:
+            self.scheduler.reschedule(self.bike.bike_id)
+
     async def terminate(self):
         """Terminate the bike brain."""
         self.running = False
@@ -78,8 +93,11 @@ class Brain:
         await self.outgoing.logs.send(logs)
 
     async def send_report(self):
-        """Send the last report."""
+        """Send the last report (batched with other bikes' reports if there is an uplink)."""
         report = self.bike.reports.last()
+        if self.uplink:
+            await self.uplink.send(self.bike.bike_id, report)
+            return
         await self.outgoing.reports.send(report)
 
     async def send_reports(self):
@@ -2,17 +2,56 @@
 This module enables the application the handle multiple brain instances (bikes).
 """
 
-from typing import Dict, Optional
+import asyncio
+from typing import Dict, List, Optional, Tuple
 from .brain import Brain
+from ._scheduler import Scheduler
+from ._uplink import Uplink
+from .._utils._map import Map
+from .._utils._registry import ZoneRegistry
+from .._utils._settings import Settings
+from ..bike._fleet import Fleet
 
 class Hivemind:
     """Handles multiple brain instances (bikes)."""
-    def __init__(self):
+    def __init__(self, registry: Optional[ZoneRegistry] = None,
+                 uplink: Optional[Uplink] = None,
+                 scheduler: Optional[Scheduler] = None,
+                 fleet: Optional[Fleet] = None):
         self.brains: Dict[int, Brain] = {}
+        self.registry = registry if registry else ZoneRegistry()
+        self.uplink = uplink
+        self.scheduler = scheduler if scheduler else Scheduler()
+        self.fleet = fleet
+
+    @staticmethod
+    async def create(bike_ids: List[int],
+                     positions: List[Tuple[float, float]],
+                     token: str) -> 'Hivemind':
+        """Create a hivemind with one initialized brain per bike."""
+        fleet = Fleet(max(len(bike_ids), 1)) if Settings.Fleet.enabled else None
+        hivemind = Hivemind(uplink=Uplink(token), fleet=fleet)
+        brains = []
+        for bike_id, (longitude, latitude) in zip(bike_ids, positions):
+            brain = Brain(
+                bike_id=bike_id,
+                longitude=longitude,
+                latitude=latitude,
+                token=token,
+                registry=hivemind.registry,
+                uplink=hivemind.uplink,
+                fleet=hivemind.fleet
+            )
+            hivemind.add_brain(bike_id, brain)
+            brains.append(brain)
+        # NOTE: Brains initialize concurrently so that their zone requests share one fetch.
+        await asyncio.gather(*(brain.initialize() for brain in brains))
+        return hivemind
 
     def add_brain(self, bike_id: int, brain: Brain):
-        """Add a brain instance to the hivemind."""
+        """Add a brain instance to the hivemind and schedule its reports."""
         self.brains[bike_id] = brain
+        self.scheduler.add(brain)
 
     def get_brain(self, bike_id: Optional[int] = None) -> Brain:
         """Retrieve a brain instance from the hivemind."""
@@ -25,3 +64,25 @@ class Hivemind:
             raise ValueError("No Brain instances available.")
         lowest_id = min(self.brains.keys())
         return self.brains[lowest_id]
+
+    async def update(self) -> Dict[str, int]:
+        """
+        Update the zones and zone types of all bikes that are not moving or charging.
+        The zones are requested once and shared by all bikes,
+        and the closest zones of all bikes are looked up in one batch.
+        """
+        brain = self.get_brain()
+        zones, zone_types = await asyncio.gather(
+            brain.request_zones(), brain.request_zone_types())
+        bikes = [brain.bike for brain in self.brains.values()
+                 if not brain.bike.is_moving_or_charging()]
+        closest_zones = [None] * len(bikes)
+        if zones and zone_types and bikes:
+            zone_set = self.registry.install(zones, zone_types)
+            closest = Map.Zones.classify(
+                zone_set.zones, zone_set.zone_types,
+                [bike.position.current for bike in bikes])['closest']
+            closest_zones = [zone_set.zones[index] if index >= 0 else None for index in closest]
+        for bike, closest_zone in zip(bikes, closest_zones):
+            bike.update(zones=zones, zone_types=zone_types, closest_zone=closest_zone)
+        return {"updated": len(bikes), "skipped": len(self.brains) - len(bikes)}
@@ -11,9 +11,11 @@ from dotenv import load_dotenv
 from ._utils._errors import Errors
 from ._utils._clock import Clock
 from .brain._initialize import Initialize
-from .brain.brain import Brain
 from .brain.hivemind import Hivemind
 from .brain._incoming import app
+from .brain._router import app as router_app, Router
+from .brain._shard import Shards
+from ._utils._settings import Settings
 
 load_dotenv()
 
@@ -89,26 +91,18 @@ async def main():
     if not positions:
         positions = list(zip([1.1] * len(bike_ids), [1.1] * len(bike_ids)))
 
-    hivemind = Hivemind()
-
-    brains = []
-    for bike_id, (longitude, latitude) in zip(bike_ids, positions):
-        brain = Brain(
-            bike_id=bike_id,
-            longitude=longitude,
-            latitude=latitude,
-            token=token
-        )
-        await brain.initialize()
-        hivemind.add_brain(bike_id, brain)
-        brains.append(brain)
-    print(f"Number of bikes: {len(bike_ids)}")
-    app.state.hivemind = hivemind
-
     host = "0.0.0.0" # NOTE: This is for it to work in Docker.
     #if platform.system() == "Windows":
     #    host = "127.0.0.1"
 
+    if Settings.Shards.count > 1:
+        await serve_shards(bike_ids, positions, token, host)
+        return
+
+    hivemind = await Hivemind.create(bike_ids, positions, token)
+    print(f"Number of bikes: {len(bike_ids)}")
+    app.state.hivemind = hivemind
+
     config = uvicorn.Config(
         app,
         host=host,
@@ -120,10 +114,31 @@ async def main():
     server = uvicorn.Server(config)
 
     await asyncio.gather(
-        *(brain.run() for brain in brains),
+        hivemind.scheduler.run(),
         server.serve()
     )
 
+async def serve_shards(bike_ids, positions, token, host):
+    """Runs the bikes in shard processes behind a router forwarding to the owning shard."""
+    count = Settings.Shards.count
+    processes = Shards.start(bike_ids, positions, token, count)
+    try:
+        router = Router(bike_ids, count)
+        await Shards.wait(router.owners)
+        print(f"Number of bikes: {len(bike_ids)} in {len(processes)} shards")
+        router_app.state.router = router
+        config = uvicorn.Config(
+            router_app,
+            host=host,
+            port=8001,
+            log_level="debug",
+            loop="asyncio",
+            lifespan="on"
+        )
+        await uvicorn.Server(config).serve()
+    finally:
+        Shards.stop(processes)
+
 # NOTE: Commented out as to not affect test coverage.
 if __name__ == "__main__": # pragma: no cover
     try:
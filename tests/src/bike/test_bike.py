@@ -1,3 +1,4 @@
+# pylint: disable=too-many-public-methods
 """Tests for the Bike class."""
 
 from unittest.mock import patch, AsyncMock
@@ -73,6 +74,18 @@ class TestBike:
         bike.speed.limit(bike.zones, bike.zone_types, bike.position.current)
         assert bike.speed.current == mock_zone_types["charging"]["speed_limit"]
 
+    @pytest.mark.asyncio
+    async def test_trip_snapshots_are_not_changed_by_moving(self, mock_zones, mock_zone_types):
+        """Test that a trip snapshot is unaffected by later movement."""
+        bike = Bike(bike_id="1", longitude=0.0, latitude=0.0)
+        bike.update(mock_zones, mock_zone_types)
+        bike.unlock(user_id=123, trip_id=456)
+        snapshot = bike.user.trip.get()
+        with patch('src._utils._clock.Clock.sleep', new=AsyncMock()):
+            await bike.move((0.001, 0.001))
+        assert snapshot['route'] == [(0.0, 0.0)]
+        assert len(bike.user.trip.get()['route']) > 1
+
     @pytest.mark.asyncio
     async def test_move_when_locked(self, mock_zones, mock_zone_types):
         """Test moving the bike when it is locked."""
@@ -0,0 +1,54 @@
+"""Tests for the Fleet class."""
+
+import pytest
+from src.bike._fleet import Fleet
+from src.bike.bike import Bike
+from src._utils._errors import InvalidModeError
+
+class TestFleet:
+    """Tests for the Fleet class."""
+
+    def test_bike_state_is_stored_in_fleet(self):
+        """Test that a bike in a fleet reads and writes its state in the fleet columns."""
+        fleet = Fleet(capacity=1)
+        bike = Bike(bike_id=7, longitude=0.0, latitude=0.0, fleet=fleet)
+        plain_bike = Bike(bike_id=7, longitude=0.0, latitude=0.0)
+        for each_bike in (bike, plain_bike):
+            each_bike.relocate((0.0005, 0.0005))
+            each_bike.unlock(user_id=1, trip_id=2)
+        snapshot = fleet.snapshot()
+        assert snapshot['bike_id'].tolist() == [7]
+        assert snapshot['longitude'].tolist() == [0.0005]
+        assert snapshot['mode'].tolist() == ['usage']
+        assert snapshot['city_id'].tolist() == [bike.city.id]
+        assert bike.position.current == (0.0005, 0.0005)
+        assert bike.reports.last() == plain_bike.reports.last()
+
+    def test_add_grows_columns(self):
+        """Test that adding more bikes than the capacity keeps earlier rows."""
+        fleet = Fleet(capacity=2)
+        bikes = [Bike(bike_id=bike_id, longitude=0.0, latitude=0.0, fleet=fleet)
+                 for bike_id in range(5)]
+        bikes[0].battery.level = 50.0
+        assert len(fleet) == 5
+        assert fleet.add(3) == 3
+        assert fleet.column('battery_level').tolist() == [50.0, 100.0, 100.0, 100.0, 100.0]
+
+    def test_drain_only_bikes_in_mode(self):
+        """Test that drain() only drains the bikes in the mode, down to zero."""
+        fleet = Fleet()
+        sleeping = Bike(bike_id=1, longitude=0.0, latitude=0.0, fleet=fleet)
+        in_use = Bike(bike_id=2, longitude=0.0, latitude=0.0, fleet=fleet)
+        in_use.unlock(user_id=1, trip_id=2)
+        fleet.drain(60, 'sleep')
+        assert sleeping.battery.level == pytest.approx(100.0 - 0.05 * 0.5 * 60)
+        assert in_use.battery.level == 100.0
+        fleet.drain(100000, 'sleep')
+        assert sleeping.battery.level == 0.0
+
+    def test_invalid_mode(self):
+        """Test that an unknown mode cannot be stored."""
+        fleet = Fleet()
+        bike = Bike(bike_id=1, longitude=0.0, latitude=0.0, fleet=fleet)
+        with pytest.raises(InvalidModeError):
+            bike.mode.current = 'flying'
@@ -46,3 +46,21 @@ class TestReports:
         duration = 0
         needed = Reports.reports_needed(duration)
         assert needed == 1
+
+    def test_reports_are_bounded(self):
+        """Test that only the most recent reports are retained."""
+        reports = Reports(capacity=2)
+        for battery_level in (100, 95, 90):
+            reports.add({"bike_id": 1, "mode": "usage", "battery_level": battery_level})
+        assert [report["battery_lvl"] for report in reports.get()] == [95, 90]
+
+    def test_last_report_is_formatted_once(self):
+        """Test that the last report is reused until a new report is added."""
+        reports = Reports()
+        reports.add({"bike_id": 1, "mode": "sleep", "battery_level": 100})
+        last = reports.last()
+        assert reports.last() is last
+        assert last.json() is last.json()
+        reports.add({"bike_id": 1, "mode": "usage", "battery_level": 95})
+        assert reports.last() is not last
+        assert reports.last()["is_available"] is False
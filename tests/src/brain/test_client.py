@@ -0,0 +1,49 @@
+"""Tests for the Client class."""
+
+from unittest.mock import patch
+import pytest
+from fastapi.testclient import TestClient
+from src.brain._client import Client
+from src.brain._incoming import app
+from src._utils._settings import Settings
+
+class TestClientPool:
+    """Tests for the shared HTTP client."""
+
+    @pytest.mark.asyncio
+    async def test_get_reuses_client(self):
+        """Test that get() returns the same open client until it is closed."""
+        client = Client.get()
+        assert Client.get() is client
+        await Client.close()
+        assert client.is_closed
+        new_client = Client.get()
+        assert new_client is not client
+        await Client.close()
+
+    @pytest.mark.asyncio
+    async def test_get_applies_connection_limits(self):
+        """Test that the client is created with the configured pool limits."""
+        with patch.object(Settings.Client, 'max_connections', 7), \
+            patch.object(Settings.Client, 'max_keepalive_connections', 3):
+            client = Client.get()
+        pool = client._transport._pool # pylint: disable=protected-access
+        assert pool._max_connections == 7 # pylint: disable=protected-access
+        assert pool._max_keepalive_connections == 3 # pylint: disable=protected-access
+        await Client.close()
+
+    @pytest.mark.asyncio
+    async def test_http2_without_h2_falls_back(self):
+        """Test that HTTP/2 is disabled when the h2 package is missing."""
+        with patch.object(Settings.Client, 'http2', True), \
+            patch('importlib.util.find_spec', return_value=None):
+            client = Client.get()
+        assert client._transport._pool._http2 is False # pylint: disable=protected-access
+        await Client.close()
+
+    def test_lifespan_closes_client(self):
+        """Test that the API closes the shared client on shutdown."""
+        with patch.object(Client, 'close') as mock_close:
+            with TestClient(app):
+                pass
+            mock_close.assert_awaited_once()
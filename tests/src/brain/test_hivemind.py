@@ -1,5 +1,6 @@
 """Tests for the Hivemind class."""
 
+from unittest.mock import patch, AsyncMock
 import pytest
 from src.brain.hivemind import Hivemind
 from src.brain.brain import Brain
@@ -54,3 +55,23 @@ class TestHivemind:
         hivemind.add_brain(1, brain_1)
         with pytest.raises(ValueError, match="Brain with bike_id 999 does not exist."):
             hivemind.get_brain(999)
+
+    @pytest.mark.asyncio
+    async def test_update_shares_zones_and_skips_moving_bikes(self, mock_zones, mock_zone_types):
+        """Test that update() requests zones once and updates all idle bikes."""
+        hivemind = Hivemind()
+        brains = [Brain(bike_id=bike_id, longitude=0.0, latitude=0.0,
+                        registry=hivemind.registry) for bike_id in (1, 2, 3)]
+        for brain in brains:
+            hivemind.add_brain(brain.bike.bike_id, brain)
+        brains[2].bike.mode.submodes.usage.moving = True
+        new_zones = mock_zones[:-1]
+        with patch.object(brains[0], 'request_zones',
+                          new=AsyncMock(return_value=new_zones)) as mock_req_zones, \
+            patch.object(brains[0], 'request_zone_types',
+                         new=AsyncMock(return_value=mock_zone_types)):
+            result = await hivemind.update()
+        mock_req_zones.assert_awaited_once()
+        assert result == {"updated": 2, "skipped": 1}
+        assert brains[0].bike.zone_set is brains[1].bike.zone_set
+        assert brains[2].bike.zone_set is not brains[0].bike.zone_set
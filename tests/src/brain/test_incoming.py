@@ -339,3 +339,16 @@ def test_update_unexpected_exception(test_client, mock_brain):
     resp_data = response.json()
     assert "Internal Server Error" in resp_data["detail"]
     assert "some unexpected error" in resp_data["detail"]
+
+@pytest.mark.usefixtures("override_get_brain")
+def test_update_fleet(test_client):
+    """Test updating the zones and zone types of the whole fleet."""
+    hivemind = Hivemind()
+    hivemind.update = AsyncMock(return_value={"updated": 2, "skipped": 1})
+    app.state.hivemind = hivemind
+    resp = test_client.post("/update?fleet=true", json={})
+    assert resp.status_code == 200
+    assert resp.json() == {
+        "message": "Zones and zone types updated",
+        "data": {"updated": 2, "skipped": 1}}
+    hivemind.update.assert_awaited_once()
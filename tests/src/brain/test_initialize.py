@@ -5,6 +5,7 @@ from unittest.mock import patch, AsyncMock, MagicMock
 import pytest
 import httpx
 from src.brain._initialize import Initialize, Extract, Serialize
+from src.brain._client import Client
 
 def _mock_response(json_data=None, status_code=200):
     """Return a mock response object."""
@@ -39,9 +40,8 @@ class TestInitialize:
             ]
         }
 
-        with patch("httpx.AsyncClient", autospec=True) as mock_client_class:
-            mock_client_instance = MagicMock()
-            mock_client_class.return_value.__aenter__.return_value = mock_client_instance
+        mock_client_instance = MagicMock()
+        with patch.object(Client, "get", return_value=mock_client_instance):
             mock_client_instance.get = AsyncMock(
                 return_value=_mock_response(json_data=mock_bike_data))
             await init.load_bikes()
@@ -53,9 +53,8 @@ class TestInitialize:
         """Test that load_bikes() does not reload bikes if they're already loaded."""
         init = Initialize(token="token")
         init.bikes = [{"bikes_already_loaded": 999}]
-        with patch("httpx.AsyncClient", autospec=True) as mock_client_class:
-            mock_client_instance = MagicMock()
-            mock_client_class.return_value.__aenter__.return_value = mock_client_instance
+        mock_client_instance = MagicMock()
+        with patch.object(Client, "get", return_value=mock_client_instance):
             mock_client_instance.get = AsyncMock()
             await init.load_bikes()
             mock_client_instance.get.assert_not_awaited()
@@ -69,9 +68,8 @@ class TestInitialize:
             "http://localhost:8000/")
         init = Initialize(token="token")
         init.bikes = None
-        with patch("httpx.AsyncClient", autospec=True) as mock_client_class:
-            mock_client_instance = MagicMock()
-            mock_client_class.return_value.__aenter__.return_value = mock_client_instance
+        mock_client_instance = MagicMock()
+        with patch.object(Client, "get", return_value=mock_client_instance):
             mock_client_instance.get.side_effect = httpx.RequestError("Connection failed")
             with pytest.raises(
                 httpx.RequestError,
@@ -101,9 +99,8 @@ class TestInitialize:
             ]
         }
 
-        with patch("httpx.AsyncClient", autospec=True) as mock_client_class:
-            mock_client_instance = MagicMock()
-            mock_client_class.return_value.__aenter__.return_value = mock_client_instance
+        mock_client_instance = MagicMock()
+        with patch.object(Client, "get", return_value=mock_client_instance):
             mock_client_instance.get = AsyncMock(
                 return_value=_mock_response(json_data=mock_bike_data))
             result = await init.bike_ids()
@@ -133,9 +130,8 @@ class TestInitialize:
             ]
         }
 
-        with patch("httpx.AsyncClient", autospec=True) as mock_client_class:
-            mock_client_instance = MagicMock()
-            mock_client_class.return_value.__aenter__.return_value = mock_client_instance
+        mock_client_instance = MagicMock()
+        with patch.object(Client, "get", return_value=mock_client_instance):
             mock_client_instance.get = AsyncMock(
                 return_value=_mock_response(json_data=mock_bike_data))
             positions_str = await init.bike_positions()
@@ -1,9 +1,11 @@
 """Tests for Outgoing class."""
 
+import asyncio
 from unittest.mock import patch, MagicMock, AsyncMock
 import pytest
 import httpx
 from src.brain._outgoing import Outgoing, Request, Logs, Reports
+from src.brain._client import Client
 
 ### OUTGOING ###
 
@@ -26,9 +28,8 @@ async def test_request_zones_success():
     """Test Request.zones() success."""
     req = Request(url="http://randomurl.com", headers={"Authorization": "Bearer"})
     mock_zones_data = {"some": "zones"}
-    with patch("httpx.AsyncClient", autospec=True) as mock_client_class:
-        mock_client_instance = MagicMock()
-        mock_client_class.return_value.__aenter__.return_value = mock_client_instance
+    mock_client_instance = MagicMock()
+    with patch.object(Client, "get", return_value=mock_client_instance):
         mock_response = MagicMock()
         mock_response.raise_for_status = MagicMock()
         mock_response.json.return_value = mock_zones_data
@@ -42,9 +43,8 @@ async def test_request_zones_success():
 async def test_request_zones_failure(capfd):
     """Test Request.zones() failure."""
     req = Request(url="http://randomurl.com", headers={})
-    with patch("httpx.AsyncClient", autospec=True) as mock_client_class:
-        mock_client_instance = MagicMock()
-        mock_client_class.return_value.__aenter__.return_value = mock_client_instance
+    mock_client_instance = MagicMock()
+    with patch.object(Client, "get", return_value=mock_client_instance):
         mock_client_instance.get.side_effect = httpx.RequestError("Connection error")
         result = await req.zones()
         assert result is None
@@ -56,9 +56,8 @@ async def test_request_zone_types_success():
     """Test Request.zone_types() success."""
     req = Request(url="http://randomurl.com", headers={"Authorization": "Bearer"})
     mock_types_data = {"some": "zone_types"}
-    with patch("httpx.AsyncClient", autospec=True) as mock_client_class:
-        mock_client_instance = MagicMock()
-        mock_client_class.return_value.__aenter__.return_value = mock_client_instance
+    mock_client_instance = MagicMock()
+    with patch.object(Client, "get", return_value=mock_client_instance):
         mock_response = MagicMock()
         mock_response.raise_for_status = MagicMock()
         mock_response.json.return_value = mock_types_data
@@ -71,9 +70,8 @@ async def test_request_zone_types_success():
 async def test_request_zone_types_failure(capfd):
     """Test Request.zone_types() failure."""
     req = Request(url="http://randomurl.com", headers={})
-    with patch("httpx.AsyncClient", autospec=True) as mock_client_class:
-        mock_client_instance = MagicMock()
-        mock_client_class.return_value.__aenter__.return_value = mock_client_instance
+    mock_client_instance = MagicMock()
+    with patch.object(Client, "get", return_value=mock_client_instance):
         mock_client_instance.get.side_effect = httpx.RequestError("Some error")
         result = await req.zone_types()
         assert result is None
@@ -87,9 +85,8 @@ async def test_logs_send_single():
     """Test sending a single log."""
     logs_obj = Logs(url="http://randomurl.com", headers={})
     single_log = {"a": "log"}
-    with patch("httpx.AsyncClient", autospec=True) as mock_client_class:
-        mock_client_instance = MagicMock()
-        mock_client_class.return_value.__aenter__.return_value = mock_client_instance
+    mock_client_instance = MagicMock()
+    with patch.object(Client, "get", return_value=mock_client_instance):
         mock_response = MagicMock()
         mock_response.raise_for_status = MagicMock()
         mock_client_instance.post = AsyncMock(return_value=mock_response)
@@ -107,9 +104,8 @@ async def test_logs_send_list():
     """Test sending a list of logs."""
     logs_obj = Logs(url="http://randomurl.com", headers={})
     log_list = [{"log": 1}, {"log": 2}]
-    with patch("httpx.AsyncClient", autospec=True) as mock_client_class:
-        mock_client_instance = MagicMock()
-        mock_client_class.return_value.__aenter__.return_value = mock_client_instance
+    mock_client_instance = MagicMock()
+    with patch.object(Client, "get", return_value=mock_client_instance):
         mock_response = MagicMock()
         mock_response.raise_for_status = MagicMock()
         mock_client_instance.post = AsyncMock(return_value=mock_response)
@@ -122,9 +118,8 @@ async def test_logs_update_single():
     """Test updating a single log."""
     logs_obj = Logs(url="http://randomurl.com", headers={})
     single_log = {"update": "log"}
-    with patch("httpx.AsyncClient", autospec=True) as mock_client_class:
-        mock_client_instance = MagicMock()
-        mock_client_class.return_value.__aenter__.return_value = mock_client_instance
+    mock_client_instance = MagicMock()
+    with patch.object(Client, "get", return_value=mock_client_instance):
         mock_response = MagicMock()
         mock_response.raise_for_status = MagicMock()
         mock_client_instance.patch = AsyncMock(return_value=mock_response)
@@ -142,9 +137,8 @@ async def test_logs_update_list():
     """Test updating a list of logs."""
     logs_obj = Logs(url="http://randomurl.com", headers={})
     log_list = [{"update": 1}, {"update": 2}]
-    with patch("httpx.AsyncClient", autospec=True) as mock_client_class:
-        mock_client_instance = MagicMock()
-        mock_client_class.return_value.__aenter__.return_value = mock_client_instance
+    mock_client_instance = MagicMock()
+    with patch.object(Client, "get", return_value=mock_client_instance):
         mock_response = MagicMock()
         mock_response.raise_for_status = MagicMock()
         mock_client_instance.patch = AsyncMock(return_value=mock_response)
@@ -157,9 +151,8 @@ async def test_logs_send_failure(capfd):
     """Test Logs.send() failure."""
     logs_obj = Logs(url="http://randomurl.com", headers={})
     single_log = {"a": "log"}
-    with patch("httpx.AsyncClient", autospec=True) as mock_client_class:
-        mock_client_instance = MagicMock()
-        mock_client_class.return_value.__aenter__.return_value = mock_client_instance
+    mock_client_instance = MagicMock()
+    with patch.object(Client, "get", return_value=mock_client_instance):
         mock_client_instance.post.side_effect = httpx.RequestError("fail to post")
         await logs_obj.send(single_log)
         captured = capfd.readouterr()
@@ -170,9 +163,8 @@ async def test_logs_update_failure_print(capfd):
     """Test Logs.update() failure."""
     logs_obj = Logs(url="http://randomurl.com", headers={})
     single_log = {"update": "this"}
-    with patch("httpx.AsyncClient", autospec=True) as mock_client_class:
-        mock_client_instance = MagicMock()
-        mock_client_class.return_value.__aenter__.return_value = mock_client_instance
+    mock_client_instance = MagicMock()
+    with patch.object(Client, "get", return_value=mock_client_instance):
         mock_client_instance.patch.side_effect = httpx.RequestError("Update error")
         await logs_obj.update(single_log)
         captured = capfd.readouterr()
@@ -185,9 +177,8 @@ async def test_reports_send_single():
     """Test Reports.send() with a single report."""
     reports_obj = Reports(url="http://randomurl.com", headers={}, bike_id=123)
     single_report = {"a": "report"}
-    with patch("httpx.AsyncClient", autospec=True) as mock_client_class:
-        mock_client_instance = MagicMock()
-        mock_client_class.return_value.__aenter__.return_value = mock_client_instance
+    mock_client_instance = MagicMock()
+    with patch.object(Client, "get", return_value=mock_client_instance):
         mock_response = MagicMock()
         mock_response.raise_for_status = MagicMock()
         mock_client_instance.patch = AsyncMock(return_value=mock_response)
@@ -206,9 +197,8 @@ async def test_reports_send_list():
     """Test Reports.send() with a list of reports."""
     reports_obj = Reports(url="http://randomurl.com", headers={}, bike_id=999)
     report_list = [{"report": 1}, {"report": 2}, {"report": 3}]
-    with patch("httpx.AsyncClient", autospec=True) as mock_client_class:
-        mock_client_instance = MagicMock()
-        mock_client_class.return_value.__aenter__.return_value = mock_client_instance
+    mock_client_instance = MagicMock()
+    with patch.object(Client, "get", return_value=mock_client_instance):
         mock_response = MagicMock()
         mock_response.raise_for_status = MagicMock()
         mock_client_instance.patch = AsyncMock(return_value=mock_response)
@@ -221,10 +211,34 @@ async def test_reports_send_failure(capfd):
     """Test Reports.send() failure."""
     reports_obj = Reports(url="http://randomurl.com", headers={}, bike_id=123)
     single_report = {"a": "report"}
-    with patch("httpx.AsyncClient", autospec=True) as mock_client_class:
-        mock_client_instance = MagicMock()
-        mock_client_class.return_value.__aenter__.return_value = mock_client_instance
+    mock_client_instance = MagicMock()
+    with patch.object(Client, "get", return_value=mock_client_instance):
         mock_client_instance.patch.side_effect = httpx.RequestError("some patch error")
         await reports_obj.send(single_report)
         captured = capfd.readouterr()
         assert "Failed to send report. some patch error" in captured.out
+
+@pytest.mark.asyncio
+async def test_request_zones_single_flight_and_conditional():
+    """Test that concurrent zone requests share one fetch and repeats are revalidated."""
+    Request.clear_cache()
+    req_1 = Request(url="http://singleflight.com", headers={"Authorization": "Bearer"})
+    req_2 = Request(url="http://singleflight.com", headers={"Authorization": "Bearer"})
+    mock_zones_data = [{"id": 1}]
+    mock_client_instance = MagicMock()
+    with patch.object(Client, "get", return_value=mock_client_instance):
+        mock_response = MagicMock(status_code=200, headers={"ETag": '"v1"'})
+        mock_response.json.return_value = mock_zones_data
+        mock_client_instance.get = AsyncMock(return_value=mock_response)
+        results = await asyncio.gather(req_1.zones(), req_2.zones())
+        assert results == [mock_zones_data, mock_zones_data]
+        mock_client_instance.get.assert_awaited_once()
+
+        not_modified = MagicMock(status_code=304, headers={})
+        mock_client_instance.get = AsyncMock(return_value=not_modified)
+        result = await req_2.zones()
+        assert result is mock_zones_data
+        sent_headers = mock_client_instance.get.await_args.kwargs["headers"]
+        assert sent_headers["If-None-Match"] == '"v1"'
+        not_modified.raise_for_status.assert_not_called()
+    Request.clear_cache()
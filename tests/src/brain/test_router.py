@@ -0,0 +1,49 @@
+"""Tests for the router of a sharded hivemind."""
+
+import httpx
+import pytest
+from fastapi.testclient import TestClient
+from src.brain._router import app, Router
+
+def shard_transport(index, calls):
+    """Returns a transport answering as the shard with the given index."""
+    def handler(request):
+        calls.append((index, request.method, request.url.path, dict(request.url.params)))
+        if request.url.path == "/update":
+            return httpx.Response(200, json={"message": "Zones and zone types updated",
+                                             "data": {"updated": index + 1, "skipped": 1}})
+        return httpx.Response(200, json={"shard": index})
+    return httpx.MockTransport(handler)
+
+@pytest.fixture(name="calls")
+def fixture_calls():
+    """Route three bikes over two shards and return the requests the shards receive."""
+    calls = []
+    app.state.router = Router([1, 2, 3], 2, [shard_transport(index, calls) for index in range(2)])
+    return calls
+
+client = TestClient(app)
+
+class TestRouter:
+    """Tests for the router of a sharded hivemind."""
+
+    def test_forward_to_owner(self, calls):
+        """Test that requests reach the shard owning the bike, or the lowest bike_id."""
+        assert client.get("/position", params={"bike_id": 2}).json() == {"shard": 0}
+        assert client.post("/lock", params={"bike_id": 3}).json() == {"shard": 1}
+        assert client.get("/position").json() == {"shard": 1}
+        assert calls[1] == (1, "POST", "/lock", {"bike_id": "3"})
+
+    def test_fleet_update_is_merged(self, calls):
+        """Test that a fleet update is sent to every shard and the counts are summed."""
+        response = client.post("/update", params={"fleet": "true", "bike_id": 1})
+        assert response.json()["data"] == {"updated": 3, "skipped": 2}
+        assert sorted(call[3]["fleet"] for call in calls) == ["true", "true"]
+        assert all("bike_id" not in call[3] for call in calls)
+
+    def test_shard_unavailable(self):
+        """Test that an unreachable shard results in a 503."""
+        def handler(request):
+            raise httpx.ConnectError("Connection refused", request=request)
+        app.state.router = Router([1], 1, [httpx.MockTransport(handler)])
+        assert client.get("/position").status_code == 503
@@ -0,0 +1,95 @@
+"""Tests for the TimerWheel and Scheduler classes."""
+
+import random
+from unittest.mock import patch, AsyncMock
+import pytest
+from src.brain._scheduler import TimerWheel, Scheduler
+from src.brain.brain import Brain
+from src._utils._clock import Clock
+
+class TestTimerWheel:
+    """Tests for the TimerWheel class."""
+
+    def test_timers_fire_on_their_deadline(self):
+        """Test that timers on every level fire exactly on their deadline tick."""
+        wheel = TimerWheel(slots=4, levels=3)
+        random.seed(1)
+        deadlines = {key: random.randint(1, 200) for key in range(100)}
+        for key, deadline in deadlines.items():
+            wheel.schedule(key, deadline)
+        fired = {}
+        for tick in range(1, 201):
+            for key in wheel.advance(tick):
+                fired[key] = tick
+        assert fired == deadlines
+        assert len(wheel) == 0
+
+    def test_advance_many_ticks_at_once(self):
+        """Test that advancing several ticks at once returns all due keys in order."""
+        wheel = TimerWheel(slots=4, levels=2)
+        wheel.schedule("late", 30)
+        wheel.schedule("early", 3)
+        assert wheel.advance(10) == ["early"]
+        assert wheel.advance(40) == ["late"]
+
+    def test_cancel_and_reschedule(self):
+        """Test that cancelled timers do not fire and rescheduled ones fire once."""
+        wheel = TimerWheel(slots=4, levels=2)
+        wheel.schedule("a", 5)
+        wheel.schedule("b", 5)
+        wheel.cancel("a")
+        wheel.schedule("b", 9)
+        assert not wheel.advance(8)
+        assert wheel.advance(9) == ["b"]
+
+    def test_past_deadline_fires_next_tick(self):
+        """Test that a deadline in the past fires on the next tick."""
+        wheel = TimerWheel()
+        wheel.advance(10)
+        wheel.schedule("a", 2)
+        assert wheel.advance(11) == ["a"]
+
+class TestScheduler:
+    """Tests for the Scheduler class."""
+
+    def test_mode_change_reschedules_bike(self):
+        """Test that a bike is rescheduled with the interval of its new mode."""
+        scheduler = Scheduler(resolution=1.0)
+        sleeping_brain = Brain(1, 0.0, 0.0, "token")
+        moving_brain = Brain(2, 0.0, 0.0, "token")
+        with patch('src.brain.brain.randint', return_value=0):
+            scheduler.add(sleeping_brain)
+            scheduler.add(moving_brain)
+            moving_brain.bike.mode.usage()
+        assert scheduler.wheel.advance(20) == [2]
+        assert scheduler.wheel.advance(310) == [1]
+
+    @pytest.mark.asyncio
+    async def test_run_fires_due_reports_and_reschedules(self):
+        """Test that run() sends due reports and schedules the next ones."""
+        scheduler = Scheduler(resolution=1.0)
+        brains = [Brain(bike_id, 0.0, 0.0, "token") for bike_id in (1, 2)]
+        for brain in brains:
+            scheduler.add(brain)
+        now = [scheduler.start]
+        async def _advance_time(seconds):
+            now[0] += 400
+            if now[0] > scheduler.start + 400 * seconds:
+                scheduler.running = False
+        with patch.object(Clock, 'monotonic', side_effect=lambda: now[0]), \
+            patch.object(Clock, 'sleep', side_effect=_advance_time), \
+            patch.object(Brain, 'send_report', new_callable=AsyncMock) as mock_send_report:
+            await scheduler.run()
+            for task in list(scheduler.tasks):
+                await task
+        assert mock_send_report.await_count == 2
+        assert len(scheduler.wheel) == 2
+
+    def test_remove_cancels_reports(self):
+        """Test that a removed brain is no longer scheduled."""
+        scheduler = Scheduler()
+        brain = Brain(1, 0.0, 0.0, "token")
+        scheduler.add(brain)
+        scheduler.remove(1)
+        assert len(scheduler.wheel) == 0
+        assert brain.scheduler is None
@@ -0,0 +1,36 @@
+"""Tests for the Shards class."""
+
+import os
+from unittest.mock import patch, AsyncMock
+import pytest
+from src.brain._shard import Shards
+from src._utils._clock import Clock
+
+class TestShards:
+    """Tests for the Shards class."""
+
+    def test_partition_by_owner(self):
+        """Test that every bike ends up in the shard that owns it, with its position."""
+        shards = Shards.partition([1, 2, 3, 4, 5], [(1.0, 1.0), (2.0, 2.0), (3.0, 3.0),
+                                                    (4.0, 4.0), (5.0, 5.0)], 2)
+        assert shards == [([2, 4], [(2.0, 2.0), (4.0, 4.0)]),
+                          ([1, 3, 5], [(1.0, 1.0), (3.0, 3.0), (5.0, 5.0)])]
+        assert all(Shards.owner(bike_id, 2) == index
+                   for index, (bike_ids, _) in enumerate(shards) for bike_id in bike_ids)
+
+    def test_start_skips_empty_shards(self):
+        """Test that no process is started for a shard without bikes."""
+        with patch('multiprocessing.context.SpawnProcess.start') as mock_start:
+            processes = Shards.start([1, 3], [(1.0, 1.0), (3.0, 3.0)], "token", 2)
+        assert [process.name for process in processes] == ['shard-1']
+        mock_start.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_wait_times_out(self, tmp_path):
+        """Test that waiting for a shard that never listens raises a TimeoutError."""
+        with patch('src._utils._settings.Settings.Shards.socket_dir', str(tmp_path)), \
+            patch.object(Clock, 'sleep', new=AsyncMock()):
+            with pytest.raises(TimeoutError):
+                await Shards.wait([0], timeout=0.0)
+            (tmp_path / os.path.basename(Shards.socket_path(0))).touch()
+            await Shards.wait([0], timeout=0.0)
@@ -0,0 +1,109 @@
+"""Tests for the Uplink class."""
+
+import asyncio
+import json
+from unittest.mock import patch, MagicMock, AsyncMock
+import pytest
+import httpx
+from src.brain._uplink import Uplink
+from src.brain._client import Client
+from src.brain.brain import Brain
+from src._utils._format import Format
+
+def _mock_response(status_code=200):
+    """Return a mock response object."""
+    mock_response = MagicMock()
+    mock_response.status_code = status_code
+    return mock_response
+
+@pytest.fixture
+def backend_url(monkeypatch):
+    """Set the backend url used by the uplink."""
+    monkeypatch.setattr(
+        "src._utils._settings.Settings.Endpoints.backend_url", "http://randomurl.com")
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("backend_url")
+async def test_uplink_sends_window_as_one_bulk_request():
+    """Test that reports sent within the window are flushed as one bulk request."""
+    uplink = Uplink("token", window=0.01, max_batch=10, bulk_endpoint="v1/bikes/bulk")
+    mock_client_instance = MagicMock()
+    mock_client_instance.patch = AsyncMock(return_value=_mock_response())
+    with patch.object(Client, "get", return_value=mock_client_instance):
+        await asyncio.gather(
+            uplink.send(1, {"speed": 1}), uplink.send(2, {"speed": 2}))
+    mock_client_instance.patch.assert_awaited_once()
+    args, kwargs = mock_client_instance.patch.await_args
+    assert args[0] == "http://randomurl.com/v1/bikes/bulk"
+    assert json.loads(kwargs["data"]) == [{"speed": 1, "id": 1}, {"speed": 2, "id": 2}]
+    assert uplink.stats() == {
+        'batches': 1, 'reports': 2, 'bulk_requests': 1, 'single_requests': 0, 'fill': 0.2}
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("backend_url")
+async def test_uplink_reuses_payload_encoding():
+    """Test that the bulk body built from payload encodings equals encoding the batch."""
+    uplink = Uplink("token", window=0.01, max_batch=10, bulk_endpoint="v1/bikes/bulk")
+    report = Format.report({"mode": "sleep", "battery_level": 50.5, "position": (1.0, 2.0)})
+    mock_client_instance = MagicMock()
+    mock_client_instance.patch = AsyncMock(return_value=_mock_response())
+    with patch.object(Client, "get", return_value=mock_client_instance):
+        await asyncio.gather(uplink.send(1, report), uplink.send(2, {"speed": 2}))
+    _, kwargs = mock_client_instance.patch.await_args
+    assert kwargs["data"] == json.dumps([dict(report, id=1), {"speed": 2, "id": 2}])
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("backend_url")
+async def test_uplink_falls_back_to_single_requests():
+    """Test that a missing bulk endpoint falls back to concurrent single PATCHes."""
+    uplink = Uplink("token", window=0.01, max_batch=10, bulk_endpoint="v1/bikes/bulk")
+    mock_client_instance = MagicMock()
+    mock_client_instance.patch = AsyncMock(
+        side_effect=[_mock_response(404), _mock_response(), _mock_response()])
+    with patch.object(Client, "get", return_value=mock_client_instance):
+        await asyncio.gather(
+            uplink.send(1, {"speed": 1}), uplink.send(2, {"speed": 2}))
+    urls = [call.args[0] for call in mock_client_instance.patch.await_args_list]
+    assert urls == ["http://randomurl.com/v1/bikes/bulk",
+                    "http://randomurl.com/v1/bikes/1",
+                    "http://randomurl.com/v1/bikes/2"]
+    assert uplink.bulk_endpoint is None
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("backend_url")
+async def test_uplink_flushes_full_batch_without_waiting():
+    """Test that a full batch is flushed before the window ends."""
+    uplink = Uplink("token", window=60.0, max_batch=2)
+    mock_client_instance = MagicMock()
+    mock_client_instance.patch = AsyncMock(return_value=_mock_response())
+    with patch.object(Client, "get", return_value=mock_client_instance):
+        await asyncio.wait_for(asyncio.gather(
+            uplink.send(1, {"speed": 1}), uplink.send(2, {"speed": 2})), timeout=1.0)
+    assert mock_client_instance.patch.await_count == 2
+    assert uplink.timer is None
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("backend_url")
+async def test_uplink_propagates_http_status_error():
+    """Test that an HTTP status error is raised to the brain that sent the report."""
+    uplink = Uplink("token", window=0.01, max_batch=10)
+    mock_response = _mock_response(500)
+    mock_response.raise_for_status.side_effect = httpx.HTTPStatusError(
+        "Server error", request=None, response=None)
+    mock_client_instance = MagicMock()
+    mock_client_instance.patch = AsyncMock(return_value=mock_response)
+    with patch.object(Client, "get", return_value=mock_client_instance):
+        with pytest.raises(httpx.HTTPStatusError):
+            await uplink.send(1, {"speed": 1})
+
+@pytest.mark.asyncio
+async def test_brain_send_report_uses_uplink():
+    """Test that a brain with an uplink sends its report through the uplink."""
+    uplink = MagicMock()
+    uplink.send = AsyncMock()
+    brain = Brain(7, 1.0, 2.0, "token", uplink=uplink)
+    brain.bike.reports.last = MagicMock(return_value={"a": "report"})
+    with patch.object(brain.outgoing.reports, 'send', new_callable=AsyncMock) as mock_send:
+        await brain.send_report()
+        mock_send.assert_not_awaited()
+    uplink.send.assert_awaited_once_with(7, {"a": "report"})
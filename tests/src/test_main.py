@@ -3,10 +3,11 @@
 
 from unittest.mock import patch, AsyncMock
 import pytest
-from src.main import main
+from src.main import main, app
 from src._utils._clock import Clock
 from src._utils._errors import InitializationError
 from src.brain._initialize import Initialize
+from src.brain._shard import Shards
 
 @pytest.mark.asyncio
 async def test_main_success(monkeypatch):
@@ -16,12 +17,15 @@ async def test_main_success(monkeypatch):
     monkeypatch.setenv("POSITIONS", "12.34:55.55,13.45:56.66")
     with patch.object(Clock, "sleep", new=AsyncMock()) as _:
         with patch("uvicorn.Server.serve", new_callable=AsyncMock) as mock_serve:
-            with patch("src.brain.brain.Brain.run", new_callable=AsyncMock) as mock_brain_run:
+            with patch(
+                "src.brain._scheduler.Scheduler.run", new_callable=AsyncMock
+                ) as mock_scheduler_run:
                 with patch.object(Initialize, "load_bikes", new=AsyncMock()) as mock_load_bikes:
                     mock_load_bikes.return_value = None
                     await main()
                     mock_serve.assert_awaited_once()
-                    assert mock_brain_run.await_count == 2
+                    mock_scheduler_run.assert_awaited_once()
+                    assert len(app.state.hivemind.scheduler.wheel) == 2
                     mock_load_bikes.assert_awaited_once()
 
 @pytest.mark.asyncio
@@ -32,11 +36,13 @@ async def test_main_fallback_init_failure(monkeypatch):
     monkeypatch.setenv("TOKEN", "fallback-token")
     with patch.object(Clock, "sleep", new=AsyncMock()):
         with patch("uvicorn.Server.serve", new_callable=AsyncMock) as mock_serve:
-            with patch("src.brain.brain.Brain.run", new_callable=AsyncMock) as mock_brain_run:
+            with patch(
+                "src.brain._scheduler.Scheduler.run", new_callable=AsyncMock
+                ) as mock_scheduler_run:
                 with patch.object(Initialize, "load_bikes", side_effect=Exception("Backend down")):
                     await main()
                     mock_serve.assert_awaited_once()
-                    mock_brain_run.assert_awaited()
+                    mock_scheduler_run.assert_awaited()
 
 @pytest.mark.asyncio
 async def test_main_missing_bike_ids(monkeypatch):
@@ -45,7 +51,7 @@ async def test_main_missing_bike_ids(monkeypatch):
     monkeypatch.setenv("TOKEN", "token")
     with patch.object(Clock, "sleep", new=AsyncMock()):
         with patch("uvicorn.Server.serve", new_callable=AsyncMock) as mock_serve:
-            with patch("src.brain.brain.Brain.run", new_callable=AsyncMock):
+            with patch("src.brain._scheduler.Scheduler.run", new=AsyncMock()):
                 with pytest.raises(InitializationError):
                     await main()
                 mock_serve.assert_not_awaited()
@@ -57,7 +63,7 @@ async def test_main_invalid_bike_ids(monkeypatch):
     monkeypatch.setenv("TOKEN", "token")
     with patch.object(Clock, "sleep", new=AsyncMock()):
         with patch("uvicorn.Server.serve", new_callable=AsyncMock) as mock_serve:
-            with patch("src.brain.brain.Brain.run", new_callable=AsyncMock):
+            with patch("src.brain._scheduler.Scheduler.run", new=AsyncMock()):
                 with pytest.raises(InitializationError):
                     await main()
                 mock_serve.assert_not_awaited()
@@ -70,7 +76,7 @@ async def test_main_mismatch_bike_ids_positions(monkeypatch):
     monkeypatch.setenv("TOKEN", "token")
     with patch.object(Clock, "sleep", new=AsyncMock()):
         with patch("uvicorn.Server.serve", new_callable=AsyncMock) as mock_serve:
-            with patch("src.brain.brain.Brain.run", new_callable=AsyncMock):
+            with patch("src.brain._scheduler.Scheduler.run", new=AsyncMock()):
                 with pytest.raises(InitializationError):
                     await main()
                 mock_serve.assert_not_awaited()
@@ -83,7 +89,7 @@ async def test_main_invalid_positions(monkeypatch):
     monkeypatch.setenv("TOKEN", "token123")
     with patch.object(Clock, "sleep", new=AsyncMock()):
         with patch("uvicorn.Server.serve", new_callable=AsyncMock) as mock_serve:
-            with patch("src.brain.brain.Brain.run", new_callable=AsyncMock):
+            with patch("src.brain._scheduler.Scheduler.run", new=AsyncMock()):
                 with pytest.raises(InitializationError):
                     await main()
                 mock_serve.assert_not_awaited()
@@ -96,7 +102,7 @@ async def test_main_default_positions(monkeypatch):
     monkeypatch.setenv("TOKEN", "token")
     with patch.object(Clock, "sleep", new=AsyncMock()):
         with patch("uvicorn.Server.serve", new_callable=AsyncMock):
-            with patch("src.brain.brain.Brain.run", new_callable=AsyncMock):
+            with patch("src.brain._scheduler.Scheduler.run", new=AsyncMock()):
                 with patch("src.brain._initialize.Initialize.load_bikes", new=AsyncMock()):
                     await main()
 
@@ -117,11 +123,32 @@ async def test_main_initialize_bike_positions(monkeypatch):
             with patch.object(Clock, "sleep", new=AsyncMock()):
                 with patch("uvicorn.Server.serve", new_callable=AsyncMock) as mock_serve:
                     with patch(
-                        "src.brain.brain.Brain.run",
+                        "src.brain._scheduler.Scheduler.run",
                         new_callable=AsyncMock
-                        ) as mock_brain_run:
+                        ) as mock_scheduler_run:
                         await main()
                         mock_bike_ids.assert_awaited_once()
                         mock_bike_positions.assert_awaited_once()
                         mock_serve.assert_awaited_once()
-                        assert mock_brain_run.await_count == 2
+                        mock_scheduler_run.assert_awaited_once()
+                        assert len(app.state.hivemind.scheduler.wheel) == 2
+
+@pytest.mark.asyncio
+async def test_main_sharded(monkeypatch):
+    """Test main() running the bikes in shard processes behind the router."""
+    monkeypatch.setenv("BIKE_IDS", "101,102")
+    monkeypatch.setenv("TOKEN", "token")
+    monkeypatch.setenv("POSITIONS", "12.34:55.55,13.45:56.66")
+    with patch.object(Clock, "sleep", new=AsyncMock()), \
+        patch("src._utils._settings.Settings.Shards.count", 2), \
+        patch.object(Initialize, "load_bikes", new=AsyncMock()), \
+        patch.object(Shards, "start", return_value=[]) as mock_start, \
+        patch.object(Shards, "wait", new=AsyncMock()) as mock_wait, \
+        patch.object(Shards, "stop") as mock_stop, \
+        patch("uvicorn.Server.serve", new_callable=AsyncMock) as mock_serve:
+        await main()
+        mock_start.assert_called_once_with(
+            [101, 102], [(12.34, 55.55), (13.45, 56.66)], "token", 2)
+        mock_wait.assert_awaited_once_with([0, 1])
+        mock_serve.assert_awaited_once()
+        mock_stop.assert_called_once_with([])
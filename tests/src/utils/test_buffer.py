@@ -0,0 +1,74 @@
+"""Tests for the Buffer and KeyedBuffer classes."""
+
+from unittest.mock import patch
+import pytest
+from src._utils._buffer import Buffer, KeyedBuffer
+
+class TestBuffer:
+    """Tests for the Buffer class."""
+
+    def test_append_drops_oldest(self):
+        """Test that a full buffer keeps only the most recent entries."""
+        buffer = Buffer(capacity=2)
+        for entry in range(5):
+            buffer.append({"n": entry})
+        assert list(buffer) == [{"n": 3}, {"n": 4}]
+        assert buffer[-1] == {"n": 4}
+        assert buffer.spilled == 3
+
+    def test_unbounded(self):
+        """Test that a buffer without capacity keeps every entry."""
+        buffer = Buffer(capacity=0)
+        for entry in range(5):
+            buffer.append(entry)
+        assert len(buffer) == 5
+        assert buffer.spilled == 0
+
+    def test_spill_to_disk(self, tmp_path):
+        """Test that dropped entries are written to the spill file, encoded, in order."""
+        spill = str(tmp_path / "reports.jsonl")
+        buffer = Buffer(capacity=1, spill=spill, encode=lambda entry: {"value": entry["n"]})
+        for entry in range(3):
+            buffer.append({"n": entry})
+        assert buffer.read_spilled() == [{"value": 0}, {"value": 1}]
+        assert list(buffer) == [{"n": 2}]
+
+    def test_spill_path(self, tmp_path):
+        """Test that spilling is only enabled when a spill directory is set."""
+        with patch('src._utils._settings.Settings.Retention.spill_dir', None):
+            assert Buffer.spill_path(1, 'reports') is None
+        with patch('src._utils._settings.Settings.Retention.spill_dir', str(tmp_path)):
+            assert Buffer.spill_path(1, 'reports') == str(tmp_path / 'bike-1-reports.jsonl')
+
+class TestKeyedBuffer:
+    """Tests for the KeyedBuffer class."""
+
+    def test_put_updates_in_place(self):
+        """Test that putting an existing key replaces the entry without moving it."""
+        buffer = KeyedBuffer(capacity=3)
+        buffer.put(1, "a")
+        buffer.put(2, "b")
+        buffer.put(1, "c")
+        assert list(buffer) == ["c", "b"]
+        assert buffer.get(1) == "c"
+        assert buffer[0] == "c"
+        assert buffer[-1] == "b"
+        assert buffer.index(2) == 1
+
+    def test_put_drops_oldest_key(self, tmp_path):
+        """Test that a full buffer drops and spills the oldest key for a new one."""
+        spill = str(tmp_path / "logs.jsonl")
+        buffer = KeyedBuffer(capacity=2, spill=spill)
+        for key in range(3):
+            buffer.put(key, {"trip_id": key})
+        assert 0 not in buffer
+        assert list(buffer) == [{"trip_id": 1}, {"trip_id": 2}]
+        assert buffer.read_spilled() == [{"trip_id": 0}]
+
+    def test_missing_key(self):
+        """Test that looking up a missing key or position fails like a list."""
+        buffer = KeyedBuffer()
+        with pytest.raises(ValueError):
+            buffer.index(1)
+        with pytest.raises(IndexError):
+            _ = buffer[0]
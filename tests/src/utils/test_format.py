@@ -1,6 +1,9 @@
 """Tests for the Format class."""
 
+import json
+import random
 from src._utils._format import Format
+from src._utils._route import Route
 
 class TestFormatter:
     """Tests for the Format class."""
@@ -113,3 +116,31 @@ class TestFormatter:
             "path_taken": "LINESTRING(0 0, 0 0)"  # LineString from start_position repeated
         }
         assert formatted == expected
+
+    def test_compiled_matches_step_by_step(self):
+        """Test that the compiled formatter gives byte-identical output to the formatting steps."""
+        random.seed(12)
+        coordinates = [0.0, -0.0, 1, 13.45, -0.05287616965672875, 1e-05, 1e20,
+                       0.1 + 0.2, -171.00000000000003] + \
+            [random.uniform(-180, 180) * random.choice([1, 1e-3, 1e6]) for _ in range(200)]
+        def position():
+            return (random.choice(coordinates), random.choice(coordinates))
+        entries = []
+        for _ in range(200):
+            entries.append({"bike_id": 1, "mode": random.choice(["sleep", "usage"]),
+                            "battery_level": random.uniform(0, 100), "speed": 10,
+                            "position": position(), "timestamp": "t", "city_id": 1})
+            entries.append({"user_id": 1, "bike_id": 1, "trip_id": 2, "id": 3,
+                            "start_time": "t", "start_position": position(),
+                            "route": [position() for _ in range(random.randint(1, 4))],
+                            "start_zone_id": None, "start_zone_type": "parking",
+                            "end_position": position(), "distance": 1, "duration": 2})
+            entries.append({"trip_id": 2, "start_position": position(),
+                            "route": Route([position() for _ in range(random.randint(5, 20))])})
+        entries.append({"trip_id": 1, "route": Route([(1.0, 2.0)]), "start_position": [1, 2]})
+        entries.append({"route": (1, 2), "mode": "sleep", "start_position": (1.0, 2.0)})
+        entries.append({"trip_id": 1, "route": [(1.0, 2.0, 3.0)], "start_position": (1, 2)})
+        for entry in entries:
+            # pylint: disable=protected-access
+            expected = json.dumps(Format._apply_all_formatting(dict(entry)))
+            assert json.dumps(Format.report(dict(entry))) == expected
@@ -0,0 +1,51 @@
+"""Tests for the GeometryCache class."""
+
+import pytest
+from src._utils._geometry import GeometryCache
+from src._utils._map import Map
+
+class TestGeometryCache:
+    """Tests for the GeometryCache class."""
+
+    @pytest.fixture(autouse=True)
+    def clear_cache(self):
+        """Start every test with an empty cache."""
+        GeometryCache.clear()
+        yield
+        GeometryCache.clear()
+
+    def test_get_parses_boundary_once(self, sample_zones_for_test_map):
+        """Test that a boundary is only parsed on the first lookup."""
+        zone = sample_zones_for_test_map[0]
+        geometry = GeometryCache.get(zone)
+        assert GeometryCache.get(dict(zone)) is geometry
+        stats = GeometryCache.stats()
+        assert stats['entries'] == 1
+        assert stats['hits'] == 1
+        assert stats['misses'] == 1
+        assert stats['bytes'] > 0
+
+    def test_get_changed_boundary_is_parsed_again(self, sample_zones_for_test_map):
+        """Test that a zone with a new boundary does not reuse the old geometry."""
+        zone = sample_zones_for_test_map[0]
+        moved_zone = dict(zone, boundary="POLYGON((9 9, 9 10, 10 10, 10 9, 9 9))")
+        assert GeometryCache.get(moved_zone) is not GeometryCache.get(zone)
+        assert GeometryCache.get(moved_zone).covers(GeometryCache.get(zone)) is False
+
+    def test_invalidate_drops_superseded_boundaries(self, sample_zones_for_test_map):
+        """Test that invalidate() drops boundaries replaced by the new zones only."""
+        for zone in sample_zones_for_test_map:
+            GeometryCache.get(zone)
+        moved_zone = dict(
+            sample_zones_for_test_map[0], boundary="POLYGON((9 9, 9 10, 10 10, 10 9, 9 9))")
+        GeometryCache.invalidate([moved_zone])
+        assert GeometryCache.stats()['entries'] == len(sample_zones_for_test_map) - 1
+        GeometryCache.invalidate()
+        assert GeometryCache.stats()['entries'] == 0
+
+    def test_map_helpers_share_cache(self, sample_zones_for_test_map):
+        """Test that the Map helpers parse each boundary only once."""
+        Map.Zone.get(sample_zones_for_test_map, (0.5, 0.5))
+        Map.Position.get_closest_zone(sample_zones_for_test_map, (10.0, 10.0))
+        Map.Zone.get_centroid_position(sample_zones_for_test_map[0])
+        assert GeometryCache.stats()['misses'] <= len(sample_zones_for_test_map)
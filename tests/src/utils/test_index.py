@@ -0,0 +1,66 @@
+"""Tests for the ZoneIndex class."""
+
+import random
+from src._utils._index import ZoneIndex
+
+class TestZoneIndex:
+    """Tests for the ZoneIndex class."""
+
+    def test_get_reuses_index_for_same_zones(self, sample_zones_for_test_map):
+        """Test that get() only builds one index per zone set."""
+        index = ZoneIndex.get(sample_zones_for_test_map)
+        assert ZoneIndex.get(sample_zones_for_test_map) is index
+        assert ZoneIndex.get(list(sample_zones_for_test_map)) is not index
+
+    def test_get_rebuilds_index_when_zones_grow(self, sample_zones_for_test_map):
+        """Test that get() rebuilds the index when zones are appended to the zone set."""
+        zones = sample_zones_for_test_map[:2]
+        index = ZoneIndex.get(zones)
+        zones.append(sample_zones_for_test_map[2])
+        rebuilt_index = ZoneIndex.get(zones)
+        assert rebuilt_index is not index
+        assert rebuilt_index.covering((4.5, 0.5))["id"] == 3
+
+    def test_covering_returns_first_zone_on_overlap(self, sample_zones_for_test_map):
+        """Test that covering() returns the first covering zone, as a linear scan would."""
+        overlapping_zone = dict(sample_zones_for_test_map[0], id=99)
+        zones = [overlapping_zone] + sample_zones_for_test_map
+        assert ZoneIndex(zones).covering((0.5, 0.5))["id"] == 99
+
+    def test_covering_boundary_and_outside(self, sample_zones_for_test_map):
+        """Test that covering() includes the boundary and returns None outside all zones."""
+        index = ZoneIndex(sample_zones_for_test_map)
+        assert index.covering((1.0, 1.0))["id"] == 1
+        assert index.covering((1.5, 0.5)) is None
+
+    def test_nearest_prefers_first_zone_on_tie(self, sample_zones_for_test_map):
+        """Test that nearest() returns the first zone when two zones are equally close."""
+        index = ZoneIndex(sample_zones_for_test_map)
+        assert index.nearest((1.5, 0.5))["id"] == 1
+        assert index.nearest((5.5, 0.5))["id"] == 3
+
+    def test_empty_zones(self):
+        """Test that an index without zones finds no zones."""
+        index = ZoneIndex([])
+        assert index.covering((0.0, 0.0)) is None
+        assert index.nearest((0.0, 0.0)) is None
+
+    def test_many_match_single_lookups(self, sample_zones_for_test_map):
+        """Test that covering_many() and nearest_many() agree with covering() and nearest()."""
+        random.seed(16)
+        positions = [(1.0, 1.0), (1.5, 0.5), (5.5, 0.5), (3.0, 2.0)] + \
+            [(random.uniform(-1, 8), random.uniform(-1, 2)) for _ in range(500)]
+        index = ZoneIndex(sample_zones_for_test_map)
+        covering = index.covering_many(positions)
+        nearest = index.nearest_many(positions, covering)
+        for position, covering_index, nearest_index in zip(positions, covering, nearest):
+            zone = index.covering(position)
+            assert (zone["id"] if zone else None) == \
+                (index.zones[covering_index]["id"] if covering_index >= 0 else None)
+            assert index.nearest(position)["id"] == index.zones[nearest_index]["id"]
+
+    def test_many_without_zones(self):
+        """Test that an index without zones finds no zones for any position."""
+        index = ZoneIndex([])
+        assert list(index.covering_many([(0.0, 0.0)])) == [-1]
+        assert list(index.nearest_many([(0.0, 0.0)])) == [-1]
@@ -236,3 +236,14 @@ class TestMap:
         with patch('os.path.dirname', return_value=str(tmp_path)):
             zone_types = Map.ZoneTypes.load()
             assert zone_types == zone_types_data
+
+    def test_classify_matches_single_lookups(
+            self, sample_zones_for_test_map, sample_zone_types_for_test_map):
+        """Test that classify() gives the same zones and speed limits as the single lookups."""
+        zones, zone_types = sample_zones_for_test_map, sample_zone_types_for_test_map
+        positions = [(0.5, 0.5), (1.5, 0.5), (4.2, 0.9), (5.5, 3.0), (6.0, 0.0)]
+        classified = Map.Zones.classify(zones, zone_types, positions)
+        assert list(classified['zone_ids']) == [1, None, 3, None, 4]
+        assert list(classified['closest_zone_ids']) == [1, 1, 3, 3, 4]
+        assert list(classified['speed_limits']) == \
+            [Map.Zone.get_speed_limit(zones, zone_types, position) for position in positions]
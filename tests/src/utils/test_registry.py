@@ -0,0 +1,59 @@
+"""Tests for the ZoneRegistry class."""
+
+from unittest.mock import patch
+import pytest
+from src._utils._registry import ZoneRegistry
+from src.bike.bike import Bike
+
+class TestZoneRegistry:
+    """Tests for the ZoneRegistry class."""
+
+    def test_acquire_loads_zones_once(self, mock_zones, mock_zone_types):
+        """Test that the zones are only read from disk for the first acquire."""
+        registry = ZoneRegistry()
+        with patch('src._utils._map.Map.Zones.load', return_value=mock_zones) as mock_load, \
+            patch('src._utils._map.Map.ZoneTypes.load', return_value=mock_zone_types):
+            first = registry.acquire()
+            second = registry.acquire()
+            mock_load.assert_called_once()
+        assert first is second
+        assert first.refs == 2
+
+    def test_zone_set_is_read_only(self, mock_zones, mock_zone_types):
+        """Test that zones and zone types in a zone set cannot be changed."""
+        registry = ZoneRegistry()
+        zone_set = registry.install(mock_zones, mock_zone_types)
+        with pytest.raises(TypeError):
+            zone_set.zones[0]['city_id'] = 99
+        with pytest.raises(TypeError):
+            zone_set.zone_types['parking']['speed_limit'] = 99
+        assert zone_set.zones[0]['id'] == mock_zones[0]['id']
+
+    def test_install_identical_zones_reuses_zone_set(self, mock_zones, mock_zone_types):
+        """Test that installing equal zones does not create a new version."""
+        registry = ZoneRegistry()
+        zone_set = registry.install(mock_zones, mock_zone_types)
+        copied_zones = [dict(zone) for zone in mock_zones]
+        assert registry.install(copied_zones, dict(mock_zone_types)) is zone_set
+        assert registry.stats()['version'] == 1
+
+    def test_swap_releases_unused_zone_set(self, mock_zones, mock_zone_types):
+        """Test that a zone set is dropped once its last reference moves to a new one."""
+        registry = ZoneRegistry()
+        old = registry.acquire(registry.install(mock_zones, mock_zone_types))
+        new = registry.swap(old, mock_zones[:2], mock_zone_types)
+        assert new.version == 2
+        assert new.refs == 1
+        assert registry.stats()['sets'] == {2: 1}
+
+    def test_bikes_share_zone_set(self, mock_zones, mock_zone_types):
+        """Test that bikes in the same registry share zones and city zones."""
+        registry = ZoneRegistry()
+        registry.install(mock_zones, mock_zone_types)
+        bike_1 = Bike(bike_id=1, longitude=0.0, latitude=0.0, registry=registry)
+        bike_2 = Bike(bike_id=2, longitude=0.0005, latitude=0.0005, registry=registry)
+        assert bike_1.zones is bike_2.zones
+        assert bike_1.city.zones is bike_2.city.zones
+        bike_1.update([dict(zone) for zone in mock_zones], dict(mock_zone_types))
+        assert bike_1.zone_set is bike_2.zone_set
+        assert bike_1.zone_set.refs == 2
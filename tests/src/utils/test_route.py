@@ -0,0 +1,33 @@
+"""Tests for the Route class."""
+
+import pytest
+from src._utils._route import Route
+
+class TestRoute:
+    """Tests for the Route class."""
+
+    def test_snapshot_is_not_changed_by_appends(self):
+        """Test that a snapshot keeps the positions it had when it was taken."""
+        route = Route([(0.0, 0.0)])
+        snapshot = route.snapshot()
+        route.append((1.0, 1.0))
+        assert snapshot == [(0.0, 0.0)]
+        assert route == [(0.0, 0.0), (1.0, 1.0)]
+        assert snapshot[-1] == (0.0, 0.0)
+        with pytest.raises(IndexError):
+            _ = snapshot[1]
+
+    def test_snapshot_shares_positions(self):
+        """Test that taking a snapshot does not copy the positions."""
+        route = Route([(0.0, 0.0), (1.0, 1.0)])
+        snapshot = route.snapshot()
+        assert snapshot[1] is route[1]
+
+    def test_append_to_stale_snapshot(self):
+        """Test that appending to an old snapshot does not affect the route."""
+        route = Route([(0.0, 0.0)])
+        snapshot = route.snapshot()
+        route.append((1.0, 1.0))
+        snapshot.append((2.0, 2.0))
+        assert route == [(0.0, 0.0), (1.0, 1.0)]
+        assert snapshot == [(0.0, 0.0), (2.0, 2.0)]
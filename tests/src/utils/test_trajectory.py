@@ -0,0 +1,39 @@
+"""Tests for the Trajectory class."""
+
+import pytest
+from src._utils._map import Map
+from src._utils._trajectory import Trajectory
+
+class TestTrajectory:
+    """Tests for the Trajectory class."""
+
+    def test_steps_per_leg(self):
+        """Test that every leg gets one step per report and ends on its vertex."""
+        speed = 0.0036 # NOTE: 0.01 degrees per 10 seconds on the planar map.
+        trajectory = Trajectory.plan((0.0, 0.0), [(0.0, 0.029), (0.019, 0.029)], speed, 10,
+                                     100.0, 0.05)
+        assert len(trajectory) == 5
+        assert trajectory.leg_ends == [False, False, True, False, True]
+        assert trajectory.positions[0] == pytest.approx((0.0, 0.01))
+        assert trajectory.positions[2] == (0.0, 0.029)
+        assert trajectory.positions[3] == pytest.approx((0.01, 0.029))
+        assert trajectory.positions[4] == (0.019, 0.029)
+        assert trajectory.sleeps == pytest.approx([29 / 3] * 3 + [19 / 2] * 2)
+
+    def test_battery_levels(self):
+        """Test that the battery drains every step and never goes below zero."""
+        trajectory = Trajectory.plan((0.0, 0.0), [(0.0, 0.029)], 0.0036, 10, 1.5, 6.0)
+        assert trajectory.battery_levels == [0.5, 0, 0]
+
+    def test_zero_length_leg(self):
+        """Test that a leg to the current position is a single step on that position."""
+        trajectory = Trajectory.plan((1.0, 1.0), [(1.0, 1.0)], 20, 10, 100.0, 0.05)
+        assert list(trajectory) == [((1.0, 1.0), pytest.approx(100.0 - 0.05 / 6), 0.0, True)]
+
+    def test_distances_match_single_distance(self):
+        """Test that the vectorized distances match the distance between two positions."""
+        starts = [(0.0, 0.0), (1.0, 2.0)]
+        ends = [(3.0, 4.0), (-1.0, 0.5)]
+        distances = Map.Position.get_distances_in_km(starts, ends)
+        assert distances.tolist() == pytest.approx(
+            [Map.Position.get_distance_in_km(start, end) for start, end in zip(starts, ends)])